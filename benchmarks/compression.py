@@ -0,0 +1,70 @@
+"""Benchmark the block-parallel gzip writer.
+
+The file is compressed with `gzip.open` and with `GzipWriter` using an
+increasing number of threads:
+
+    python benchmarks/compression.py data/tasks/nlp-progress.json -l 6
+"""
+
+import os
+import sys
+import gzip
+import timeit
+import argparse
+import tempfile
+
+from sota_extractor.compression import GzipWriter
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("file", help="File to compress.")
+    parser.add_argument(
+        "-l", "--level", type=int, default=9, help="Compression level."
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Numbers of threads compressing the blocks.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of times the file is compressed.",
+    )
+    ns = parser.parse_args(args)
+
+    with open(ns.file, "rb") as f:
+        data = f.read()
+
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "output.gz")
+
+        def gzip_open():
+            with gzip.open(output, mode="wb", compresslevel=ns.level) as f:
+                f.write(data)
+
+        run("gzip.open", gzip_open, output, ns.repeat)
+        for workers in ns.workers:
+
+            def writer():
+                with GzipWriter(
+                    output, compresslevel=ns.level, workers=workers
+                ) as f:
+                    f.write(data)
+
+            run(f"GzipWriter({workers})", writer, output, ns.repeat)
+
+
+def run(name, fn, output, repeat):
+    t = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f"{name:<20}{t:8.4f}s  {os.path.getsize(output):>12} bytes")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
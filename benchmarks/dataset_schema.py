@@ -0,0 +1,138 @@
+"""Benchmark DatasetSchema.load with and without deep copying the input.
+
+`DatasetSchema.pre_load` used to deep copy every dataset to rename its name
+key, now it only copies the top level of the dataset. The datasets of all
+the files, and a single dataset with many rows, are loaded with both
+versions:
+
+    python benchmarks/dataset_schema.py data/tasks/*.json
+"""
+
+import os
+import sys
+import copy
+import glob
+import json
+import timeit
+import argparse
+import tracemalloc
+
+from marshmallow import ValidationError, pre_load
+
+from sota_extractor.taskdb.v01.schemas import DatasetSchema
+
+
+class DeepcopyDatasetSchema(DatasetSchema):
+    """DatasetSchema with the previous, deep copying `pre_load`."""
+
+    @pre_load
+    def pre_load(self, data, **kwargs):
+        data = copy.deepcopy(data)
+        if "dataset" in data:
+            data["name"] = data["dataset"]
+            data["is_subdataset"] = False
+            del data["dataset"]
+        elif "subdataset" in data:
+            data["name"] = data["subdataset"]
+            data["is_subdataset"] = True
+            del data["subdataset"]
+        else:
+            data["name"] = ""
+            data["is_subdataset"] = False
+        return data
+
+
+def find_datasets(tasks, out):
+    """Collect the datasets of the tasks and their subtasks."""
+    for task in tasks:
+        out.extend(task.get("datasets", []))
+        find_datasets(task.get("subtasks", []), out)
+    return out
+
+
+def large_dataset(rows):
+    return {
+        "dataset": "Large",
+        "sota": {
+            "metrics": ["F1", "EM"],
+            "rows": [
+                {
+                    "model_name": f"Model {i}",
+                    "paper_title": f"Paper {i}",
+                    "paper_url": f"https://example.com/{i}",
+                    "paper_date": "2019-01-02",
+                    "metrics": {"F1": "95.1", "EM": "90.2"},
+                    "code_links": [{"title": "code", "url": "https://a.b"}],
+                }
+                for i in range(rows)
+            ],
+        },
+    }
+
+
+def load(schema, datasets):
+    try:
+        schema.load(datasets, many=True)
+    except ValidationError:
+        # Invalid datasets are still loaded up to the error.
+        pass
+
+
+def trace(fn):
+    """Get the peak memory in bytes allocated by the function."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=sorted(glob.glob(os.path.join("data", "tasks", "*.json"))),
+        help="TaskDB json files.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times the datasets are loaded.",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=20000,
+        help="Number of rows of the large dataset.",
+    )
+    ns = parser.parse_args(args)
+
+    datasets = []
+    for filename in ns.files:
+        with open(filename, "rb") as f:
+            find_datasets(json.load(f), datasets)
+
+    for name, data in [
+        (f"{len(datasets)} datasets", datasets),
+        (f"{ns.rows} rows", [large_dataset(ns.rows)]),
+    ]:
+        for schema in [DeepcopyDatasetSchema(), DatasetSchema()]:
+            t = min(
+                timeit.repeat(
+                    lambda: load(schema, data), number=1, repeat=ns.repeat
+                )
+            )
+            peak = trace(lambda: load(schema, data))
+            print(
+                f"{name:<20}{schema.__class__.__name__:<24}"
+                f"{t:8.4f}s  {peak / 2 ** 20:8.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
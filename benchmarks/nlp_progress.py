@@ -0,0 +1,70 @@
+"""Benchmark parsing of the NLP-progress markdown files.
+
+Every file is parsed by rendering it to HTML, which is how the files used to
+be parsed, by stopping after the tree processors and by the line based
+parser. Run it on a checkout of the NLP-progress repository:
+
+    git clone https://github.com/sebastianruder/NLP-progress
+    python benchmarks/nlp_progress.py NLP-progress/english/*.md
+"""
+
+import io
+import os
+import sys
+import timeit
+import argparse
+
+from sota_extractor.scrapers.nlp_progress.markdown import Markdown
+
+
+def render(text):
+    Markdown().convert(text)
+
+
+def parse(text):
+    Markdown().parse(text)
+
+
+def parse_lines(text):
+    Markdown().parse(text, line_parser=True)
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("files", nargs="+", help="Markdown files.")
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times every file is parsed.",
+    )
+    ns = parser.parse_args(args)
+
+    methods = [("render", render), ("parse", parse), ("lines", parse_lines)]
+    totals = [0.0] * len(methods)
+    for filename in ns.files:
+        with io.open(filename, mode="r", encoding="utf-8") as f:
+            text = f.read().lstrip("\ufeff")
+
+        times = [
+            min(timeit.repeat(lambda: fn(text), number=1, repeat=ns.repeat))
+            for _, fn in methods
+        ]
+        totals = [total + t for total, t in zip(totals, times)]
+        print_times(os.path.basename(filename), methods, times)
+    print_times("total", methods, totals)
+
+
+def print_times(name, methods, times):
+    print(
+        f"{name:<40}"
+        + "  ".join(
+            f"{method} {t:8.4f}s ({times[0] / t:4.1f}x)"
+            for (method, _), t in zip(methods, times)
+        )
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
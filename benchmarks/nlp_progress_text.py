@@ -0,0 +1,71 @@
+"""Benchmark the text and link extraction of the NLP-progress parser.
+
+The markdown files are parsed into element trees once, then `Text.parse` is
+timed over the descriptions of every section and the cells of every table.
+Run it on a checkout of the NLP-progress repository:
+
+    git clone https://github.com/sebastianruder/NLP-progress
+    python benchmarks/nlp_progress_text.py NLP-progress/english/*.md
+"""
+
+import io
+import sys
+import timeit
+import argparse
+
+from markdown.treeprocessors import Treeprocessor
+
+from sota_extractor.scrapers.nlp_progress.parsers import Text
+from sota_extractor.scrapers.nlp_progress.markdown import Markdown
+
+
+class TreeCollector(Treeprocessor):
+    def run(self, root):
+        self.root = root
+
+
+def collect(text):
+    """Get the element tree the tasks are parsed from."""
+    md = Markdown()
+    collector = TreeCollector(md)
+    # Run just before the parser processor.
+    md.treeprocessors.register(collector, "tree_collector", 2)
+    md.parse(text)
+    return collector.root
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("files", nargs="+", help="Markdown files.")
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times the extraction is timed.",
+    )
+    ns = parser.parse_args(args)
+
+    sections = []
+    cells = []
+    for filename in ns.files:
+        with io.open(filename, mode="r", encoding="utf-8") as f:
+            root = collect(f.read().lstrip("\ufeff"))
+        sections.append([el for el in root if el.tag != "table"])
+        cells.extend(root.iter("td"))
+
+    def extract():
+        for section in sections:
+            Text.parse(section)
+        for cell in cells:
+            Text.parse(cell, keep_links=False)
+
+    times = timeit.repeat(extract, number=1, repeat=ns.repeat)
+    print(
+        f"{len(sections)} files, {len(cells)} cells: "
+        f"min {min(times):8.4f}s  mean {sum(times) / len(times):8.4f}s"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
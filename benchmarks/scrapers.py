@@ -0,0 +1,61 @@
+"""Benchmark the parse phase of the scrapers.
+
+The scrapers are replayed from a fixture bundle, so no network access is
+needed and the results are reproducible. With the package installed
+(`pip install -e .`) record a bundle with:
+
+    sota-extractor --record fixtures/ scrape-all
+
+and time the parsers with:
+
+    python benchmarks/scrapers.py fixtures/
+"""
+
+import sys
+import timeit
+import argparse
+import importlib
+
+from sota_extractor import scrapers
+from sota_extractor.errors import SotaError
+from sota_extractor.scrapers import client
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("bundle", help="Path to the fixture bundle.")
+    parser.add_argument(
+        "scrapers",
+        nargs="*",
+        default=scrapers.__all__,
+        help="Scrapers to benchmark, all by default.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times every parser is timed.",
+    )
+    ns = parser.parse_args(args)
+
+    client.configure(replay_dir=ns.bundle)
+    for name in ns.scrapers:
+        scraper = importlib.import_module(f"sota_extractor.scrapers.{name}")
+        try:
+            payload = scraper.fetch()
+        except SotaError as e:
+            print(f"{name:<14} skipped  {e}")
+            continue
+
+        times = timeit.repeat(
+            lambda: scraper.parse(payload), number=1, repeat=ns.repeat
+        )
+        print(
+            f"{name:<14} min {min(times):8.4f}s  "
+            f"mean {sum(times) / len(times):8.4f}s"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""Benchmark the JSON backends used for serialization.
+
+Every file is rendered with indentation, the way TaskDB files are dumped, and
+parsed with each available backend:
+
+    python benchmarks/serialization.py data/tasks/*.json
+"""
+
+import os
+import sys
+import glob
+import timeit
+import argparse
+
+from sota_extractor.errors import ArgumentError
+from sota_extractor.jsonlib import BACKENDS, get_backend
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=sorted(glob.glob(os.path.join("data", "tasks", "*.json"))),
+        help="TaskDB json files.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times every file is rendered and parsed.",
+    )
+    ns = parser.parse_args(args)
+
+    backends = []
+    for name in BACKENDS:
+        try:
+            backends.append(get_backend(name))
+        except ArgumentError as e:
+            print(e.message)
+
+    totals = {}
+    for filename in ns.files:
+        with open(filename, "rb") as f:
+            text = f.read()
+        data = backends[0].loads(text)
+
+        for backend in backends:
+            times = [
+                min(timeit.repeat(fn, number=1, repeat=ns.repeat))
+                for fn in [
+                    lambda: backend.dumps(data, indent=True),
+                    lambda: backend.loads(text),
+                ]
+            ]
+            totals[backend.name] = [
+                total + t
+                for total, t in zip(totals.get(backend.name, [0, 0]), times)
+            ]
+            print_times(os.path.basename(filename), backend.name, times)
+    for name, times in totals.items():
+        print_times("total", name, times)
+
+
+def print_times(name, backend, times):
+    dumps, loads = times
+    print(f"{name:<30}{backend:<8}dumps {dumps:8.4f}s  loads {loads:8.4f}s")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""Benchmark the memory used by the TaskDB models and the compact models.
+
+All the files are loaded together with each kind of models and the memory
+kept by the tasks, including the strings parsed from the files, is reported
+per SOTA row:
+
+    python benchmarks/taskdb_compact.py data/tasks/*.json
+"""
+
+import gc
+import os
+import sys
+import glob
+import json
+import argparse
+import tracemalloc
+
+from marshmallow import ValidationError
+
+from sota_extractor.taskdb.v01 import decoder
+
+
+def build(files, compact):
+    """Load the valid tasks from all the files."""
+    tasks = []
+    for filename in files:
+        with open(filename, "rb") as f:
+            data = json.load(f)
+        try:
+            for task in decoder.iter_tasks(data, compact=compact):
+                tasks.append(task)
+        except ValidationError:
+            # Invalid tasks are skipped.
+            pass
+    return tasks
+
+
+def count_rows(tasks):
+    return sum(
+        count_dataset_rows(task.datasets) + count_rows(task.subtasks)
+        for task in tasks
+    )
+
+
+def count_dataset_rows(datasets):
+    return sum(
+        len(dataset.sota.rows) + count_dataset_rows(dataset.subdatasets)
+        for dataset in datasets
+    )
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=sorted(glob.glob(os.path.join("data", "tasks", "*.json"))),
+        help="TaskDB json files.",
+    )
+    ns = parser.parse_args(args)
+
+    for name, compact in [("models", False), ("compact", True)]:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            tasks = build(ns.files, compact)
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        rows = count_rows(tasks)
+        print(
+            f"{name:<10}{size / 2 ** 20:8.2f} MiB  {rows} rows  "
+            f"{size / rows:8.1f} bytes/row"
+        )
+        del tasks
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
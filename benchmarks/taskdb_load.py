@@ -0,0 +1,81 @@
+"""Benchmark loading of the TaskDB files.
+
+Every file is deserialized once, then the tasks are built from the data with
+the marshmallow schema (`strict=True`), with the native decoder and lazily,
+building only the tasks that are accessed (none here):
+
+    python benchmarks/taskdb_load.py data/tasks/*.json
+"""
+
+import os
+import sys
+import glob
+import json
+import timeit
+import argparse
+
+from marshmallow import ValidationError
+
+from sota_extractor.taskdb.v01 import TaskDB
+
+
+def load(data, method):
+    try:
+        TaskDB().load_tasks(
+            data=data, strict=method == "strict", lazy=method == "lazy"
+        )
+    except ValidationError:
+        # Files that don't validate are still timed up to the error.
+        pass
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=sorted(glob.glob(os.path.join("data", "tasks", "*.json"))),
+        help="TaskDB json files.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times every file is loaded.",
+    )
+    ns = parser.parse_args(args)
+
+    methods = ["strict", "native", "lazy"]
+    totals = [0.0] * len(methods)
+    for filename in ns.files:
+        with open(filename, "rb") as f:
+            data = json.load(f)
+
+        times = [
+            min(
+                timeit.repeat(
+                    lambda: load(data, method),
+                    number=1,
+                    repeat=ns.repeat,
+                )
+            )
+            for method in methods
+        ]
+        totals = [total + t for total, t in zip(totals, times)]
+        print_times(os.path.basename(filename), methods, times)
+    print_times("total", methods, totals)
+
+
+def print_times(name, methods, times):
+    print(
+        f"{name:<40}"
+        + "  ".join(
+            f"{method} {t:8.4f}s ({times[0] / t:4.1f}x)"
+            for method, t in zip(methods, times)
+        )
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
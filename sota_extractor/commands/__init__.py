@@ -1,5 +1,11 @@
-__all__ = ["cli", "eff", "reddit", "snli", "squad", "evaluate"]
+__all__ = ["cli", "eff", "reddit", "snli", "squad", "scrape_all", "evaluate"]
 
 from sota_extractor.commands.cli import cli
-from sota_extractor.commands.scrapers import eff, reddit, snli, squad
+from sota_extractor.commands.scrapers import (
+    eff,
+    reddit,
+    snli,
+    squad,
+    scrape_all,
+)
 from sota_extractor.commands.evaluate import evaluate
@@ -1,6 +1,45 @@
 import click
 
+from sota_extractor.scrapers import client
+
 
 @click.group()
-def cli():
-    pass
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    required=False,
+    default=None,
+    help=(
+        "Directory in which the scraped responses are cached. Defaults to "
+        "the SOTA_EXTRACTOR_CACHE_DIR environment variable."
+    ),
+)
+@click.option(
+    "--record",
+    type=click.Path(file_okay=False),
+    required=False,
+    default=None,
+    help="Record all the fetched documents into a fixture bundle.",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, file_okay=False),
+    required=False,
+    default=None,
+    help="Replay the fetched documents from a fixture bundle.",
+)
+def cli(cache_dir, record, replay):
+    if record is not None and replay is not None:
+        raise click.UsageError("--record and --replay are mutually exclusive.")
+
+    settings = {
+        name: value
+        for name, value in [
+            ("cache_dir", cache_dir),
+            ("record_dir", record),
+            ("replay_dir", replay),
+        ]
+        if value is not None
+    }
+    if settings:
+        client.configure(**settings)
@@ -1,9 +1,40 @@
+import io
+import os
+import sys
+import time
+import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import click
 from sota_extractor import scrapers
-from sota_extractor.consts import Format
+from sota_extractor.consts import (
+    Format,
+    NLP_PROGRESS_WORKERS,
+    NLP_PROGRESS_LINE_PARSER,
+)
 from sota_extractor import serialization
 from sota_extractor.commands.cli import cli
 from sota_extractor.errors import catch_errors
+from sota_extractor.scrapers import client
+from sota_extractor.scrapers.cache import OutputCache
+
+# Default output file for every scraper exported from sota_extractor.scrapers.
+OUTPUTS = {
+    "eff": "data/tasks/eff.json",
+    "reddit": "data/tasks/redditsota.json",
+    "snli": "data/tasks/snli.json",
+    "squad": "data/tasks/squad.json",
+    "cityscapes": "data/tasks/cityscapes.json",
+    "nlp_progress": "data/tasks/nlp-progress.json",
+    "smcalflow": "data/tasks/smcalflow.json",
+    "record": "data/tasks/record.json",
+    "hotpotqa": "data/tasks/hotpotqa.json",
+    "coqa": "data/tasks/coqa.json",
+    "chexpert": "data/tasks/chexpert.json",
+    "cmrc": "data/tasks/cmrc.json",
+    "xtreme": "data/tasks/xtreme.json",
+    "ogb": "data/tasks/ogb.json",
+}
 
 
 @cli.command()
@@ -12,7 +43,7 @@ from sota_extractor.errors import catch_errors
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/eff.json",
+    default=OUTPUTS["eff"],
     help="Output filename.",
 )
 @click.option(
@@ -25,7 +56,7 @@ from sota_extractor.errors import catch_errors
 @catch_errors
 def eff(output, fmt):
     """Extract EFF SOTA tables."""
-    serialization.dump(tdb=scrapers.eff(), output=output, fmt=fmt)
+    run_scraper("eff", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -34,7 +65,7 @@ def eff(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/redditsota.json",
+    default=OUTPUTS["reddit"],
     help="Output filename.",
 )
 @click.option(
@@ -47,7 +78,7 @@ def eff(output, fmt):
 @catch_errors
 def reddit(output, fmt):
     """Extract Reddit SOTA tables."""
-    serialization.dump(tdb=scrapers.reddit(), output=output, fmt=fmt)
+    run_scraper("reddit", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -56,7 +87,7 @@ def reddit(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/snli.json",
+    default=OUTPUTS["snli"],
     help="Output filename.",
 )
 @click.option(
@@ -69,7 +100,7 @@ def reddit(output, fmt):
 @catch_errors
 def snli(output, fmt):
     """Extract SNLI SOTA tables."""
-    serialization.dump(tdb=scrapers.snli(), output=output, fmt=fmt)
+    run_scraper("snli", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -78,7 +109,7 @@ def snli(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/squad.json",
+    default=OUTPUTS["squad"],
     help="Output filename.",
 )
 @click.option(
@@ -91,7 +122,7 @@ def snli(output, fmt):
 @catch_errors
 def squad(output, fmt):
     """Extract SQUAD SOTA tables."""
-    serialization.dump(tdb=scrapers.squad(), output=output, fmt=fmt)
+    run_scraper("squad", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -100,7 +131,7 @@ def squad(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/cityscapes.json",
+    default=OUTPUTS["cityscapes"],
     help="Output filename.",
 )
 @click.option(
@@ -113,7 +144,7 @@ def squad(output, fmt):
 @catch_errors
 def cityscapes(output, fmt):
     """Extract Cityscapes SOTA tables."""
-    serialization.dump(tdb=scrapers.cityscapes(), output=output, fmt=fmt)
+    run_scraper("cityscapes", output=output, fmt=fmt)
 
 
 @cli.command("nlp-progress")
@@ -122,7 +153,7 @@ def cityscapes(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/nlp-progress.json",
+    default=OUTPUTS["nlp_progress"],
     help="Output filename.",
 )
 @click.option(
@@ -132,10 +163,28 @@ def cityscapes(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=NLP_PROGRESS_WORKERS,
+    help="Number of processes parsing the markdown files.",
+)
+@click.option(
+    "--line-parser/--markdown-parser",
+    default=NLP_PROGRESS_LINE_PARSER,
+    help="Parse the markdown files line by line.",
+)
 @catch_errors
-def nlp_progress(output, fmt):
+def nlp_progress(output, fmt, workers, line_parser):
     """Extract NLP Progress SOTA tables."""
-    serialization.dump(tdb=scrapers.nlp_progress(), output=output, fmt=fmt)
+    run_scraper(
+        "nlp_progress",
+        output=output,
+        fmt=fmt,
+        workers=workers,
+        line_parser=line_parser,
+    )
 
 
 @cli.command()
@@ -144,7 +193,7 @@ def nlp_progress(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/smcalflow.json",
+    default=OUTPUTS["smcalflow"],
     help="Output filename.",
 )
 @click.option(
@@ -157,7 +206,7 @@ def nlp_progress(output, fmt):
 @catch_errors
 def smcalflow(output, fmt):
     """Extract Smcalflow SOTA tables."""
-    serialization.dump(tdb=scrapers.smcalflow(), output=output, fmt=fmt)
+    run_scraper("smcalflow", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -166,7 +215,7 @@ def smcalflow(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/record.json",
+    default=OUTPUTS["record"],
     help="Output filename.",
 )
 @click.option(
@@ -179,7 +228,7 @@ def smcalflow(output, fmt):
 @catch_errors
 def record(output, fmt):
     """Extract Record SOTA tables."""
-    serialization.dump(tdb=scrapers.record(), output=output, fmt=fmt)
+    run_scraper("record", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -188,7 +237,7 @@ def record(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/hotpotqa.json",
+    default=OUTPUTS["hotpotqa"],
     help="Output filename.",
 )
 @click.option(
@@ -201,7 +250,7 @@ def record(output, fmt):
 @catch_errors
 def hotpotqa(output, fmt):
     """Extract hotpotqa SOTA tables."""
-    serialization.dump(tdb=scrapers.hotpotqa(), output=output, fmt=fmt)
+    run_scraper("hotpotqa", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -210,7 +259,7 @@ def hotpotqa(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/coqa.json",
+    default=OUTPUTS["coqa"],
     help="Output filename.",
 )
 @click.option(
@@ -223,7 +272,7 @@ def hotpotqa(output, fmt):
 @catch_errors
 def coqa(output, fmt):
     """Extract coqa SOTA tables."""
-    serialization.dump(tdb=scrapers.coqa(), output=output, fmt=fmt)
+    run_scraper("coqa", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -232,7 +281,7 @@ def coqa(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/chexpert.json",
+    default=OUTPUTS["chexpert"],
     help="Output filename.",
 )
 @click.option(
@@ -245,7 +294,7 @@ def coqa(output, fmt):
 @catch_errors
 def chexpert(output, fmt):
     """Extract chexpert SOTA tables."""
-    serialization.dump(tdb=scrapers.chexpert(), output=output, fmt=fmt)
+    run_scraper("chexpert", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -254,7 +303,7 @@ def chexpert(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/cmrc.json",
+    default=OUTPUTS["cmrc"],
     help="Output filename.",
 )
 @click.option(
@@ -267,7 +316,7 @@ def chexpert(output, fmt):
 @catch_errors
 def cmrc(output, fmt):
     """Extract cmrc SOTA tables."""
-    serialization.dump(tdb=scrapers.cmrc(), output=output, fmt=fmt)
+    run_scraper("cmrc", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -276,7 +325,7 @@ def cmrc(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/xtreme.json",
+    default=OUTPUTS["xtreme"],
     help="Output filename.",
 )
 @click.option(
@@ -289,7 +338,7 @@ def cmrc(output, fmt):
 @catch_errors
 def xtreme(output, fmt):
     """Extract Xtreme SOTA tables."""
-    serialization.dump(tdb=scrapers.xtreme(), output=output, fmt=fmt)
+    run_scraper("xtreme", output=output, fmt=fmt)
 
 
 @cli.command()
@@ -298,7 +347,7 @@ def xtreme(output, fmt):
     "--output",
     type=click.Path(exists=False),
     required=False,
-    default="data/tasks/ogb.json",
+    default=OUTPUTS["ogb"],
     help="Output filename.",
 )
 @click.option(
@@ -311,4 +360,122 @@ def xtreme(output, fmt):
 @catch_errors
 def ogb(output, fmt):
     """Extract OGB SOTA tables."""
-    serialization.dump(tdb=scrapers.ogb(), output=output, fmt=fmt)
+    run_scraper("ogb", output=output, fmt=fmt)
+
+
+def output_path(name: str, fmt: Format) -> str:
+    """Get the default output path of a scraper for the selected format."""
+    output = OUTPUTS[name]
+    if fmt != Format.json:
+        output = f"{output[: -len('.json')]}.{fmt.value}"
+    return output
+
+
+def run_scraper(name: str, output: str, fmt: Format, **kwargs) -> bool:
+    """Run a single scraper by name and serialize its output.
+
+    Keyword arguments are passed to the `parse` function of the scraper.
+
+    If a cache directory is configured, serialized outputs are cached by the
+    hash of the documents the scraper fetched. When none of them changed the
+    output is served from the cache and neither parsed nor serialized again,
+    and the output file is not touched if it's already up to date.
+
+    Returns:
+        bool: True if the output was served from the cache.
+    """
+    scraper = importlib.import_module(f"sota_extractor.scrapers.{name}")
+    payload = scraper.fetch()
+
+    cache_dir = client.get_client().cache_dir
+    # Sharded outputs only rewrite the shards that changed anyway.
+    if cache_dir is None or fmt == Format.shards:
+        serialization.dump(
+            tdb=scraper.parse(payload, **kwargs), output=output, fmt=fmt
+        )
+        return False
+
+    cache = OutputCache(os.path.join(cache_dir, "outputs"))
+    key = cache.key(
+        name=name, version=scraper.VERSION, fmt=fmt, payload=payload
+    )
+    data = cache.load(key)
+    if data is None:
+        serialization.dump(
+            tdb=scraper.parse(payload, **kwargs), output=output, fmt=fmt
+        )
+        with io.open(output, mode="rb") as fp:
+            cache.store(key, fp.read())
+        return False
+
+    if os.path.exists(output) and os.path.getsize(output) == len(data):
+        with io.open(output, mode="rb") as fp:
+            if fp.read() == data:
+                return True
+    with io.open(output, mode="wb") as fp:
+        fp.write(data)
+    return True
+
+
+def timed_run_scraper(name: str, fmt: Format):
+    """Run a scraper into its default output and measure the wall time.
+
+    Returns:
+        Tuple[float, str, Optional[Exception]]: Wall time in seconds, the
+            status of the run and the error raised by the scraper if it
+            failed.
+    """
+    start = time.perf_counter()
+    try:
+        cached = run_scraper(name=name, output=output_path(name, fmt), fmt=fmt)
+    except Exception as e:
+        return time.perf_counter() - start, "failed", e
+    return time.perf_counter() - start, "cached" if cached else "ok", None
+
+
+@cli.command("scrape-all")
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Maximum number of scrapers running at the same time.",
+)
+@click.option(
+    "-f",
+    "--fmt",
+    type=click.Choice(Format),
+    default=Format.json,
+    help="Output format.",
+)
+@catch_errors
+def scrape_all(workers, fmt):
+    """Run all the scrapers concurrently."""
+    start = time.perf_counter()
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(timed_run_scraper, name=name, fmt=fmt): name
+            for name in scrapers.__all__
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            elapsed, status, error = future.result()
+            if error is None:
+                click.secho(
+                    f"{name:<14} {status:<6} {elapsed:8.2f}s", fg="green"
+                )
+            else:
+                failed.append(name)
+                click.secho(
+                    f"{name:<14} {status:<6} {elapsed:8.2f}s  {error}",
+                    fg="red",
+                )
+
+    total = len(scrapers.__all__)
+    click.echo(
+        f"Finished {total - len(failed)}/{total} scrapers in "
+        f"{time.perf_counter() - start:.2f}s."
+    )
+    if failed:
+        sys.exit(1)
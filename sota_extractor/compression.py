@@ -0,0 +1,96 @@
+"""Block-parallel gzip compression.
+
+The data is split into blocks that are compressed into independent gzip
+members on a thread pool (zlib releases the GIL while compressing) and
+written in order. A file of concatenated members is a valid gzip file that
+is decompressed by `gzip.open` or the `gzip` utility as a whole.
+"""
+
+import io
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque
+
+from sota_extractor.consts import GZIP_LEVEL, GZIP_WORKERS
+
+# Number of bytes compressed into a single gzip member.
+BLOCK_SIZE = 1024 * 1024
+
+
+class GzipWriter(io.BufferedIOBase):
+    """Binary file object writing a block-parallel gzip file.
+
+    The members are written without a timestamp, so the same data always
+    compresses to the same file.
+
+    Args:
+        filename (str): Path to the output file.
+        compresslevel (int): Compression level from 1 to 9.
+        workers (int): Number of threads compressing the blocks.
+        block_size (int): Number of bytes compressed into a single member.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        compresslevel: int = GZIP_LEVEL,
+        workers: int = GZIP_WORKERS,
+        block_size: int = BLOCK_SIZE,
+    ):
+        super().__init__()
+        self.compresslevel = compresslevel
+        self.workers = workers
+        self.block_size = block_size
+        self.block = bytearray()
+        self.fp = io.open(filename, mode="wb")
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        # Members being compressed, in the order they are written
+        self.pending: Deque[Future] = deque()
+        self.empty = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        self.block += data
+        while len(self.block) >= self.block_size:
+            self.submit(self.block[: self.block_size])
+            del self.block[: self.block_size]
+        return len(data)
+
+    def submit(self, block: bytearray):
+        """Compress the block in the background."""
+        self.empty = False
+        self.pending.append(
+            self.executor.submit(
+                compress_member, bytes(block), self.compresslevel
+            )
+        )
+        # Limit the number of blocks kept in memory.
+        while len(self.pending) > 2 * self.workers:
+            self.fp.write(self.pending.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            # Empty data is still written as a single empty member.
+            if self.block or self.empty:
+                self.submit(self.block)
+                self.block = bytearray()
+            while self.pending:
+                self.fp.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown()
+            self.fp.close()
+            super().close()
+
+
+def compress_member(data: bytes, compresslevel: int) -> bytes:
+    """Compress data into a single gzip member without a timestamp."""
+    # Window bits over 16 produce a gzip header and trailer.
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + 15)
+    return compressor.compress(data) + compressor.flush()
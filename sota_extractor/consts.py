@@ -1,23 +1,73 @@
 import os
 import enum
 
-
 DEBUG = os.environ.get("SOTA_EXTRACTOR_DEBUG", "false").lower() == "true"
 
+# HTTP client defaults, see `sota_extractor.scrapers.client`.
+HTTP_CONNECT_TIMEOUT = float(
+    os.environ.get("SOTA_EXTRACTOR_HTTP_CONNECT_TIMEOUT", "10")
+)
+HTTP_READ_TIMEOUT = float(
+    os.environ.get("SOTA_EXTRACTOR_HTTP_READ_TIMEOUT", "60")
+)
+HTTP_RETRIES = int(os.environ.get("SOTA_EXTRACTOR_HTTP_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(
+    os.environ.get("SOTA_EXTRACTOR_HTTP_BACKOFF_FACTOR", "0.5")
+)
+HTTP_POOL_MAXSIZE = int(
+    os.environ.get("SOTA_EXTRACTOR_HTTP_POOL_MAXSIZE", "10")
+)
+
+# Directory of the on-disk HTTP response cache, disabled when not set.
+CACHE_DIR = os.environ.get("SOTA_EXTRACTOR_CACHE_DIR", None)
+
+# Fixture bundle into which the fetched documents are recorded or from which
+# they are replayed instead of accessing the network.
+RECORD_DIR = os.environ.get("SOTA_EXTRACTOR_RECORD_DIR", None)
+REPLAY_DIR = os.environ.get("SOTA_EXTRACTOR_REPLAY_DIR", None)
+
+# JSON library used for serialization: "orjson", "stdlib" or "auto" to use
+# orjson if it's installed, see `sota_extractor.jsonlib`.
+JSON_BACKEND = os.environ.get("SOTA_EXTRACTOR_JSON_BACKEND", "auto")
+
+# Compression level and number of threads compressing the gzip formats, see
+# `sota_extractor.compression`.
+GZIP_LEVEL = int(os.environ.get("SOTA_EXTRACTOR_GZIP_LEVEL", "9"))
+GZIP_WORKERS = int(
+    os.environ.get("SOTA_EXTRACTOR_GZIP_WORKERS", os.cpu_count() or 1)
+)
+
 
 class Format(str, enum.Enum):
     """Output format.
 
-    At the moment only supported format is JSON, but in the future YAML support
-    is planned.
+    Tasks are serialized either as a single JSON array or as JSON lines with
+    one task per line, optionally gzip compressed, or into a directory of
+    shards with a JSON file per top-level task, see `sota_extractor.shards`.
     """
 
     json = "json"
     json_gz = "json.gz"
+    jsonl = "jsonl"
+    jsonl_gz = "jsonl.gz"
+    shards = "shards"
 
 
 NLP_PROGRESS_REPO = "https://github.com/sebastianruder/NLP-progress"
 
+# Number of processes parsing the NLP progress markdown files, defaults to the
+# number of CPUs.
+NLP_PROGRESS_WORKERS = int(
+    os.environ.get("SOTA_EXTRACTOR_NLP_PROGRESS_WORKERS", os.cpu_count() or 1)
+)
+
+# Parse the NLP progress markdown files with the line based parser instead of
+# the python-markdown block parser.
+NLP_PROGRESS_LINE_PARSER = (
+    os.environ.get("SOTA_EXTRACTOR_NLP_PROGRESS_LINE_PARSER", "false").lower()
+    == "true"
+)
+
 
 EFF_TASK_CONVERSION = dict(
     [
@@ -0,0 +1,30 @@
+import io
+import os
+import tempfile
+
+
+def write_atomic(filename: str, data: bytes):
+    """Write data to a file so concurrent readers never see a partial file."""
+    directory = os.path.dirname(filename)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with io.open(fd, mode="wb") as fp:
+            fp.write(data)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_changed(filename: str, data: bytes) -> bool:
+    """Write data to a file unless it already has the same content.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    if os.path.exists(filename) and os.path.getsize(filename) == len(data):
+        with io.open(filename, mode="rb") as fp:
+            if fp.read() == data:
+                return False
+    write_atomic(filename, data)
+    return True
@@ -0,0 +1,171 @@
+"""JSON backends used for serialization.
+
+The stdlib `json` module is always available. If `orjson` is installed it's
+used instead, rendering the exact same output: sorted keys, indentation of two
+spaces and non-ASCII characters escaped. The backend can be selected with the
+`SOTA_EXTRACTOR_JSON_BACKEND` environment variable or by name in the
+serialization functions.
+"""
+
+import re
+import json
+import math
+import itertools
+from typing import Any, Dict, Optional, Union
+
+from sota_extractor.consts import JSON_BACKEND
+from sota_extractor.errors import ArgumentError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonBackend:
+    """Renders and parses JSON with the stdlib `json` module."""
+
+    name = "stdlib"
+
+    def dumps(self, data: Any, indent: bool = False) -> str:
+        """Render data to a JSON string with sorted keys.
+
+        Args:
+            data: Data to render.
+            indent (bool): Indent the output by two spaces, otherwise the
+                output is rendered on a single line without whitespace.
+
+        Returns:
+            str: JSON string.
+        """
+        if indent:
+            return json.dumps(data, indent=2, sort_keys=True)
+        return json.dumps(data, separators=(",", ":"), sort_keys=True)
+
+    def loads(self, text: Union[str, bytes]) -> Any:
+        """Parse a JSON string."""
+        return json.loads(text)
+
+
+class OrjsonBackend(JsonBackend):
+    """Renders and parses JSON with `orjson`.
+
+    Output that `orjson` would render differently than the stdlib (floats in
+    exponent notation, NaN and infinity rendered as null, integers over 64
+    bits, ...) and input it doesn't accept (NaN, ...) are handled by the
+    stdlib.
+    """
+
+    name = "orjson"
+
+    # Possible floats `orjson` renders differently than the stdlib, in
+    # exponent notation or close to zero. Mostly found inside strings.
+    # Patterns with a literal prefix are searched for much faster.
+    FLOATS = [re.compile(r"e-?\d"), re.compile(r"0\.0000")]
+    NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?=[,\n\]}]|\Z)")
+    # Characters escaped by the stdlib.
+    NON_ASCII = re.compile(r"[^\x00-\x7e]")
+    # `orjson` parses integers over 64 bits as floats, they have at least 19
+    # digits (negative ones below -2 ** 63 have 19). Mapping all the digits to
+    # zeros finds runs of digits much faster than a regular expression.
+    DIGITS = bytes.maketrans(b"123456789", b"000000000")
+    LONG_NUMBER = b"0" * 19
+
+    def dumps(self, data: Any, indent: bool = False) -> str:
+        # Let the stdlib reject types it can't serialize.
+        option = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            text = orjson.dumps(data, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return super().dumps(data, indent=indent)
+        if self.has_floats(text):
+            return super().dumps(data, indent=indent)
+        # NaN and infinity are rendered as null.
+        if "null" in text and has_non_finite(data):
+            return super().dumps(data, indent=indent)
+        if text.isascii() and "\x7f" not in text:
+            return text
+        # Non-ASCII characters can only appear inside strings.
+        return self.NON_ASCII.sub(escape, text)
+
+    def has_floats(self, text: str) -> bool:
+        """Check if the JSON string contains floats rendered differently."""
+        matches = itertools.chain.from_iterable(
+            pattern.finditer(text) for pattern in self.FLOATS
+        )
+        for match in matches:
+            start = match.start()
+            while start > 0 and text[start - 1] in "0123456789.-+eE":
+                start -= 1
+            # Check that the number is not inside a string.
+            if start > 0 and text[start - 1] not in " \n:,[":
+                continue
+            number = self.NUMBER.match(text, start)
+            if number is not None and number.end() >= match.end():
+                return True
+        return False
+
+    def loads(self, text: Union[str, bytes]) -> Any:
+        data = text.encode("utf-8") if isinstance(text, str) else text
+        if data.translate(self.DIGITS).find(self.LONG_NUMBER) != -1:
+            return super().loads(text)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(text)
+
+
+def has_non_finite(data: Any) -> bool:
+    """Check if the data contains NaN or infinite floats."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float) and not math.isfinite(value):
+            return True
+    return False
+
+
+def escape(match: re.Match) -> str:
+    """Escape a character the way the stdlib does."""
+    n = ord(match.group(0))
+    if n < 0x10000:
+        return f"\\u{n:04x}"
+    n -= 0x10000
+    return f"\\u{0xD800 | (n >> 10):04x}\\u{0xDC00 | (n & 0x3FF):04x}"
+
+
+BACKENDS: Dict[str, JsonBackend] = {
+    "stdlib": JsonBackend(),
+    "orjson": OrjsonBackend(),
+}
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """Get a JSON backend by name.
+
+    Args:
+        name (str): "orjson", "stdlib" or "auto" to use `orjson` if it's
+            installed. Defaults to the `SOTA_EXTRACTOR_JSON_BACKEND`
+            environment variable.
+
+    Returns:
+        JsonBackend: The backend.
+    """
+    name = (name or JSON_BACKEND).lower()
+    if name == "auto":
+        name = "stdlib" if orjson is None else "orjson"
+    if name not in BACKENDS:
+        raise ArgumentError(f"Unknown JSON backend: {name}")
+    if name == "orjson" and orjson is None:
+        raise ArgumentError("JSON backend orjson is not installed.")
+    return BACKENDS[name]
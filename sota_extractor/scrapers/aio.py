@@ -0,0 +1,114 @@
+"""Asynchronous variants of the scrapers.
+
+Every scraper is run from the default executor of the running event loop, so
+awaiting it never blocks the loop, neither on the network nor on parsing.
+The requests are still the blocking `requests` calls of the shared HTTP
+client, with its connection pool, cache and fixtures: every running scraper
+holds an executor thread while it fetches, and the documents of a scraper
+are fetched concurrently by `fetch_texts` threads, not on the event loop.
+"""
+
+__all__ = [
+    "scrape",
+    "eff",
+    "snli",
+    "squad",
+    "reddit",
+    "cityscapes",
+    "nlp_progress",
+    "coqa",
+    "chexpert",
+    "cmrc",
+    "record",
+    "hotpotqa",
+    "smcalflow",
+    "xtreme",
+    "ogb",
+]
+
+import asyncio
+import importlib
+
+from sota_extractor.taskdb.v01 import TaskDB
+
+
+async def scrape(name: str) -> TaskDB:
+    """Run a scraper by name.
+
+    Args:
+        name (str): Name of the scraper, one of `sota_extractor.scrapers`.
+    """
+    scraper = importlib.import_module(f"sota_extractor.scrapers.{name}")
+    loop = asyncio.get_running_loop()
+    payload = await loop.run_in_executor(None, scraper.fetch)
+    return await loop.run_in_executor(None, scraper.parse, payload)
+
+
+async def eff() -> TaskDB:
+    """Extract EFF SOTA tables."""
+    return await scrape("eff")
+
+
+async def snli() -> TaskDB:
+    """Extract SNLI SOTA tables."""
+    return await scrape("snli")
+
+
+async def squad() -> TaskDB:
+    """Extract SQUAD SOTA tables."""
+    return await scrape("squad")
+
+
+async def reddit() -> TaskDB:
+    """Extract Reddit SOTA tables."""
+    return await scrape("reddit")
+
+
+async def cityscapes() -> TaskDB:
+    """Extract Cityscapes SOTA tables."""
+    return await scrape("cityscapes")
+
+
+async def nlp_progress() -> TaskDB:
+    """Extract NLP Progress SOTA tables."""
+    return await scrape("nlp_progress")
+
+
+async def coqa() -> TaskDB:
+    """Extract CoQA SOTA tables."""
+    return await scrape("coqa")
+
+
+async def chexpert() -> TaskDB:
+    """Extract CheXpert SOTA tables."""
+    return await scrape("chexpert")
+
+
+async def cmrc() -> TaskDB:
+    """Extract CMRC SOTA tables."""
+    return await scrape("cmrc")
+
+
+async def record() -> TaskDB:
+    """Extract ReCoRD SOTA tables."""
+    return await scrape("record")
+
+
+async def hotpotqa() -> TaskDB:
+    """Extract HotpotQA SOTA tables."""
+    return await scrape("hotpotqa")
+
+
+async def smcalflow() -> TaskDB:
+    """Extract SMCalFlow SOTA tables."""
+    return await scrape("smcalflow")
+
+
+async def xtreme() -> TaskDB:
+    """Extract Xtreme SOTA tables."""
+    return await scrape("xtreme")
+
+
+async def ogb() -> TaskDB:
+    """Extract OGB SOTA tables."""
+    return await scrape("ogb")
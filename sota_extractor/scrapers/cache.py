@@ -0,0 +1,205 @@
+import io
+import os
+import json
+import hashlib
+from typing import Dict, Optional
+
+import requests
+from marshmallow import ValidationError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from sota_extractor.consts import Format
+from sota_extractor.files import write_atomic
+from sota_extractor.jsonlib import get_backend
+from sota_extractor.taskdb.v01 import TaskDB
+
+
+class ResponseStore:
+    """On-disk store of HTTP responses.
+
+    Every entry consists of two files named after the hash of the URL: the
+    raw response body and a json document with the status code and headers.
+
+    Args:
+        directory (str): Path to the store directory, created if missing.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key)
+
+    def _meta(self, url: str) -> Optional[Dict]:
+        try:
+            with io.open(f"{self._path(url)}.json", encoding="utf-8") as fp:
+                meta = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get("url") == url else None
+
+    def load(self, url: str) -> Optional[requests.Response]:
+        """Rebuild the stored response for the URL."""
+        meta = self._meta(url)
+        if meta is None:
+            return None
+        try:
+            with io.open(f"{self._path(url)}.body", mode="rb") as fp:
+                content = fp.read()
+        except OSError:
+            return None
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = meta["status_code"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        return response
+
+    def save(self, url: str, response: requests.Response):
+        """Store the response."""
+        path = self._path(url)
+        # The body is written first, so the stored headers never describe a
+        # newer body than the one on disk.
+        write_atomic(f"{path}.body", response.content)
+        write_atomic(
+            f"{path}.json",
+            json.dumps(
+                {
+                    "url": url,
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                }
+            ).encode("utf-8"),
+        )
+
+
+class ResponseCache(ResponseStore):
+    """On-disk cache of HTTP responses and their validators.
+
+    Only successful responses that carry an `ETag` or a `Last-Modified` header
+    are stored.
+
+    Args:
+        directory (str): Path to the cache directory, created if missing.
+    """
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Get the conditional request headers for a cached URL."""
+        meta = self._meta(url)
+        if meta is None:
+            return {}
+
+        headers = CaseInsensitiveDict(meta["headers"])
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def store(self, url: str, response: requests.Response):
+        """Store the response if it can be revalidated later."""
+        if response.status_code != 200:
+            return
+        if (
+            "ETag" not in response.headers
+            and "Last-Modified" not in response.headers
+        ):
+            return
+        self.save(url, response)
+
+
+class OutputCache:
+    """Content addressed cache of serialized scraper outputs.
+
+    Outputs are keyed by the hash of everything they are derived from: the
+    scraper name and version, the serialization format and the raw documents
+    fetched by the scraper. If the upstream documents did not change since
+    the last run, the serialized output can be taken from the cache without
+    parsing the documents again.
+
+    Scrapers expose a module level `VERSION` which has to be increased every
+    time the output of their `parse` function changes, otherwise stale
+    outputs would be served from the cache.
+
+    Args:
+        directory (str): Path to the cache directory, created if missing.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        name: str, version: int, fmt: Format, payload: Dict[str, str]
+    ) -> str:
+        """Compute the cache key of a scraper output.
+
+        Args:
+            name (str): Scraper name.
+            version (int): Scraper version.
+            fmt (Format): Serialization format.
+            payload (Dict[str, str]): Documents fetched by the scraper.
+        """
+        h = hashlib.sha256()
+        parts = [name, str(version), fmt.value]
+        for source in sorted(payload):
+            parts.extend((source, payload[source]))
+        for part in parts:
+            data = part.encode("utf-8")
+            h.update(len(data).to_bytes(8, "big"))
+            h.update(data)
+        return h.hexdigest()
+
+    def load(self, key: str) -> Optional[bytes]:
+        """Get the cached output or None if it's not cached."""
+        try:
+            with io.open(os.path.join(self.directory, key), mode="rb") as fp:
+                return fp.read()
+        except OSError:
+            return None
+
+    def store(self, key: str, data: bytes):
+        """Store the serialized output."""
+        write_atomic(os.path.join(self.directory, key), data)
+
+
+class TaskDBCache:
+    """On-disk cache of parsed TaskDB instances.
+
+    Args:
+        directory (str): Path to the cache directory, created if missing.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, key: str) -> Optional[TaskDB]:
+        """Get the cached TaskDB or None if it's not cached.
+
+        Unreadable, corrupt or invalid entries are treated as not cached.
+        """
+        tdb = TaskDB()
+        try:
+            with io.open(
+                os.path.join(self.directory, f"{key}.json"), encoding="utf-8"
+            ) as fp:
+                data = get_backend().loads(fp.read())
+            tdb.load_tasks(data=data)
+        except (OSError, ValueError, ValidationError):
+            return None
+        return tdb
+
+    def store(self, key: str, tdb: TaskDB):
+        """Store the TaskDB."""
+        write_atomic(
+            os.path.join(self.directory, f"{key}.json"),
+            get_backend().dumps(tdb.export()).encode("utf-8"),
+        )
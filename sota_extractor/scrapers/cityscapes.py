@@ -1,7 +1,12 @@
+from typing import Dict
+
+from bs4 import BeautifulSoup
 from sota_extractor.errors import DataError
-from sota_extractor.scrapers.utils import get_soup
+from sota_extractor.scrapers.utils import fetch_texts
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
 
+VERSION = 1
+
 CITYSCAPES_URL = (
     "https://www.cityscapes-dataset.com/benchmarks/#pixel-level-results"
 )
@@ -53,9 +58,14 @@ def get_sota_rows(table):
     return sota_rows
 
 
-def cityscapes() -> TaskDB:
-    """Extract Cityscapes SOTA tables."""
-    soup = get_soup(CITYSCAPES_URL)
+def fetch() -> Dict[str, str]:
+    """Fetch the raw Cityscapes benchmarks page."""
+    return fetch_texts([CITYSCAPES_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the Cityscapes benchmarks page fetched by `fetch`."""
+    soup = BeautifulSoup(payload[CITYSCAPES_URL], "lxml")
 
     sota_tabels = soup.findAll("table", attrs={"class": "tablepress"})
 
@@ -85,3 +95,8 @@ def cityscapes() -> TaskDB:
         return tdb
     else:
         raise DataError("Got an unexpected number of SOTA tables.")
+
+
+def cityscapes() -> TaskDB:
+    """Extract Cityscapes SOTA tables."""
+    return parse(fetch())
@@ -0,0 +1,225 @@
+import os
+import asyncio
+import logging
+import threading
+import functools
+from typing import Callable, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from sota_extractor import consts
+from sota_extractor.errors import ArgumentError, HttpClientError
+from sota_extractor.scrapers.cache import ResponseCache
+from sota_extractor.scrapers.fixtures import FixtureBundle
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    """HTTP client shared by all the scrapers.
+
+    Wraps a single `requests.Session` so the connections (and TLS sessions)
+    are reused between requests to the same host. Every request has a
+    connect/read timeout and failed requests are retried with an exponential
+    backoff.
+
+    If a cache directory is configured, responses are cached on disk and
+    revalidated with `If-None-Match`/`If-Modified-Since` requests. Every
+    returned response has a `not_modified` attribute which is `True` when the
+    body was served from the cache because the resource did not change since
+    the last run.
+
+    In record mode every fetched document is also saved into a fixture
+    bundle. In replay mode the documents are served from a recorded bundle
+    and the network is never accessed, which makes it possible to run and
+    benchmark the scrapers offline.
+
+    Args:
+        connect_timeout (float): Seconds to wait for the connection.
+        read_timeout (float): Seconds to wait between bytes of the response.
+        retries (int): Maximum number of retries of a failed request.
+        backoff_factor (float): Factor of the exponential delay between the
+            retries.
+        pool_maxsize (int): Maximum number of connections kept open per host.
+            Requests over the limit wait for a free connection.
+        cache_dir (str, optional): Directory of the response cache. Responses
+            are not cached if not set.
+        record_dir (str, optional): Fixture bundle into which the fetched
+            documents are recorded.
+        replay_dir (str, optional): Fixture bundle from which the documents
+            are replayed.
+    """
+
+    # Status codes on which the request is retried.
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        connect_timeout: float = consts.HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = consts.HTTP_READ_TIMEOUT,
+        retries: int = consts.HTTP_RETRIES,
+        backoff_factor: float = consts.HTTP_BACKOFF_FACTOR,
+        pool_maxsize: int = consts.HTTP_POOL_MAXSIZE,
+        cache_dir: Optional[str] = consts.CACHE_DIR,
+        record_dir: Optional[str] = consts.RECORD_DIR,
+        replay_dir: Optional[str] = consts.REPLAY_DIR,
+    ):
+        if record_dir is not None and replay_dir is not None:
+            raise ArgumentError("Cannot both record and replay fixtures.")
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache_dir = cache_dir
+        self.cache = (
+            ResponseCache(os.path.join(cache_dir, "http"))
+            if cache_dir is not None
+            else None
+        )
+        self.recorder = (
+            FixtureBundle(record_dir) if record_dir is not None else None
+        )
+        self.player = (
+            FixtureBundle(replay_dir) if replay_dir is not None else None
+        )
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_maxsize, pool_block=True, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request.
+
+        Args:
+            url (str): URL to fetch.
+            kwargs: Additional arguments passed to `requests.Session.get`.
+        """
+        if self.player is not None:
+            response = self.player.load(url)
+            if response is None:
+                raise HttpClientError(f"Response not recorded: {url}")
+            response.not_modified = False
+            return response
+
+        response = self._get(url, **kwargs)
+        if self.recorder is not None:
+            self.recorder.save(url, response)
+        return response
+
+    async def aget(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request without blocking the event loop.
+
+        The blocking request is sent from the default executor of the running
+        loop, holding one of its threads, so it shares the connection pool,
+        cache and fixtures with `get`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.get, url, **kwargs)
+        )
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        if self.cache is None:
+            logger.debug("GET %s", url)
+            response = self.session.get(url, **kwargs)
+            response.not_modified = False
+            return response
+
+        headers = kwargs.pop("headers", None) or {}
+        validators = self.cache.validators(url)
+        logger.debug("GET %s (conditional: %s)", url, bool(validators))
+        response = self.session.get(
+            url, headers={**validators, **headers}, **kwargs
+        )
+        if response.status_code == 304:
+            cached = self.cache.load(url)
+            if cached is not None:
+                cached.not_modified = True
+                return cached
+            # The cached body disappeared, fetch the whole resource again.
+            response = self.session.get(url, headers=headers, **kwargs)
+
+        self.cache.store(url, response)
+        response.not_modified = False
+        return response
+
+    def get_documents(
+        self, source: str, load: Callable[[], Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Get documents which are not fetched over HTTP.
+
+        Makes the documents part of the recorded and replayed fixtures.
+
+        Args:
+            source (str): URL of the source, e.g. of a git repository.
+            load: Function that fetches the documents from the source.
+        """
+        if self.player is not None:
+            documents = self.player.load_documents(source)
+            if documents is None:
+                raise HttpClientError(f"Documents not recorded: {source}")
+            return documents
+
+        documents = load()
+        if self.recorder is not None:
+            self.recorder.save_documents(source, documents)
+        return documents
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_lock = threading.Lock()
+
+
+def configure(**kwargs) -> HttpClient:
+    """Replace the shared client with one created with the given settings.
+
+    Accepts the same arguments as `HttpClient`, unspecified settings are
+    taken from the `SOTA_EXTRACTOR_*` environment variables.
+    """
+    global _client
+
+    with _lock:
+        if _client is not None:
+            _client.close()
+        _client = HttpClient(**kwargs)
+        return _client
+
+
+def get_client() -> HttpClient:
+    """Get the shared client, creating it on first use."""
+    global _client
+
+    with _lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request with the shared client."""
+    return get_client().get(url, **kwargs)
+
+
+async def aget(url: str, **kwargs) -> requests.Response:
+    """Send a GET request with the shared client without blocking."""
+    return await get_client().aget(url, **kwargs)
+
+
+def get_documents(
+    source: str, load: Callable[[], Dict[str, str]]
+) -> Dict[str, str]:
+    """Get documents which are not fetched over HTTP with the shared client."""
+    return get_client().get_documents(source, load)
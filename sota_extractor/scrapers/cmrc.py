@@ -1,12 +1,13 @@
 from datetime import datetime
+from typing import Dict
 
-import requests
-
-from sota_extractor.scrapers.utils import sround
-from sota_extractor.errors import HttpClientError
+from sota_extractor.scrapers.utils import fetch_texts, load_json, sround
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
 
 
+VERSION = 1
+
+
 URL_2018 = "http://ymcui.com/cmrc2018/"
 URL_2019 = "http://ymcui.com/cmrc2019/"
 
@@ -96,13 +97,15 @@ def get_sota_rows(data):
     return sota_rows
 
 
-def cmrc() -> TaskDB:
-    """Extract CMRC SOTA tables."""
-    try:
-        cmrc_2018 = requests.get(CMRC_2018_JSON_URL).json()
-        cmrc_2019 = requests.get(CMRC_2019_JSON_URL).json()
-    except Exception as e:
-        raise HttpClientError(message=str(e))
+def fetch() -> Dict[str, str]:
+    """Fetch the raw CMRC leaderboards."""
+    return fetch_texts([CMRC_2018_JSON_URL, CMRC_2019_JSON_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the CMRC leaderboards fetched by `fetch`."""
+    cmrc_2018 = load_json(payload[CMRC_2018_JSON_URL])
+    cmrc_2019 = load_json(payload[CMRC_2019_JSON_URL])
 
     dataset_2018 = Dataset(
         name=DATASET_2018_NAME,
@@ -134,3 +137,8 @@ def cmrc() -> TaskDB:
     tdb = TaskDB()
     tdb.add_task(task)
     return tdb
+
+
+def cmrc() -> TaskDB:
+    """Extract CMRC SOTA tables."""
+    return parse(fetch())
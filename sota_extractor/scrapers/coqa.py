@@ -1,10 +1,17 @@
-import requests
+from typing import Dict
 
-from sota_extractor.errors import HttpClientError
-from sota_extractor.scrapers.utils import date_from_timestamp, sround
+from sota_extractor.scrapers.utils import (
+    date_from_timestamp,
+    fetch_texts,
+    load_json,
+    sround,
+)
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
 
 
+VERSION = 1
+
+
 URL = "https://stanfordnlp.github.io/coqa/"
 JSON_URL = (
     "https://raw.githubusercontent.com/stanfordnlp/coqa/master/out-v1.0.json"
@@ -64,12 +71,14 @@ def get_sota_rows(data):
     return sota_rows
 
 
-def coqa() -> TaskDB:
-    """Extract SQUAD SOTA tables."""
-    try:
-        data = requests.get(JSON_URL).json()
-    except Exception as e:
-        raise HttpClientError(message=str(e))
+def fetch() -> Dict[str, str]:
+    """Fetch the raw CoQA leaderboard."""
+    return fetch_texts([JSON_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the CoQA leaderboard fetched by `fetch`."""
+    data = load_json(payload[JSON_URL])
 
     dataset = Dataset(name=DATASET_NAME, is_subdataset=False)
     task = Task(name=TASK_NAME)
@@ -84,3 +93,8 @@ def coqa() -> TaskDB:
     tdb = TaskDB()
     tdb.add_task(task)
     return tdb
+
+
+def coqa() -> TaskDB:
+    """Extract SQUAD SOTA tables."""
+    return parse(fetch())
@@ -1,5 +1,7 @@
 import json
-import requests
+from typing import Dict
+
+from sota_extractor.scrapers import client
 from sota_extractor.errors import HttpClientError
 from sota_extractor.consts import EFF_TASK_CONVERSION
 from sota_extractor.taskdb.v01 import (
@@ -11,19 +13,25 @@ from sota_extractor.taskdb.v01 import (
     TaskDB,
 )
 
+VERSION = 1
+
 EFF_URL = (
     "https://raw.githubusercontent.com/AI-metrics/AI-metrics/master/"
     "export-api/v01/progress.json"
 )
 
 
-def eff() -> TaskDB:
-    """Extract EFF SOTA tables."""
-
-    response = requests.get(EFF_URL)
+def fetch() -> Dict[str, str]:
+    """Fetch the raw EFF progress document."""
+    response = client.get(EFF_URL)
     if response.status_code != 200:
         raise HttpClientError("Resource unavailable", response=response)
-    j = json.loads(response.text)
+    return {EFF_URL: response.text}
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the EFF progress document fetched by `fetch`."""
+    j = json.loads(payload[EFF_URL])
     tdb = TaskDB()
 
     for problem in j["problems"]:
@@ -75,3 +83,8 @@ def eff() -> TaskDB:
         tdb.add_task(task)
 
     return tdb
+
+
+def eff() -> TaskDB:
+    """Extract EFF SOTA tables."""
+    return parse(fetch())
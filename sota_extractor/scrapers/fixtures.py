@@ -0,0 +1,36 @@
+import json
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from sota_extractor.scrapers.cache import ResponseStore
+
+
+class FixtureBundle(ResponseStore):
+    """Bundle of recorded upstream documents used to replay the scrapers.
+
+    HTTP responses are stored as they were received. Documents which are not
+    fetched over HTTP (e.g. the files of a git checkout) are stored together
+    as a single json response under the URL of their source.
+
+    Args:
+        directory (str): Path to the bundle directory, created if missing.
+    """
+
+    def save_documents(self, source: str, documents: Dict[str, str]):
+        """Store the documents fetched from a source."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/json; charset=utf-8"}
+        )
+        response._content = json.dumps(documents).encode("utf-8")
+        self.save(source, response)
+
+    def load_documents(self, source: str) -> Optional[Dict[str, str]]:
+        """Get the stored documents of a source."""
+        response = self.load(source)
+        if response is None:
+            return None
+        return response.json()
@@ -1,12 +1,18 @@
 import re
+from typing import Dict
 
-import requests
-
-from sota_extractor.errors import HttpClientError
-from sota_extractor.scrapers.utils import date_from_timestamp, sround
+from sota_extractor.scrapers.utils import (
+    date_from_timestamp,
+    fetch_texts,
+    load_json,
+    sround,
+)
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
 
 
+VERSION = 1
+
+
 URL = "https://hotpotqa.github.io/"
 JSON_URL = (
     "https://raw.githubusercontent.com/hotpotqa/hotpotqa.github.io/master/"
@@ -78,12 +84,14 @@ def get_sota_rows(data):
     return sota_rows
 
 
-def hotpotqa() -> TaskDB:
-    """Extract HotpotQA SOTA tables."""
-    try:
-        data = requests.get(JSON_URL).json()
-    except Exception as e:
-        raise HttpClientError(message=str(e))
+def fetch() -> Dict[str, str]:
+    """Fetch the raw HotpotQA leaderboard."""
+    return fetch_texts([JSON_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the HotpotQA leaderboard fetched by `fetch`."""
+    data = load_json(payload[JSON_URL])
 
     dataset = Dataset(name=DATASET_NAME, is_subdataset=False)
     task = Task(name=TASK_NAME)
@@ -105,3 +113,8 @@ def hotpotqa() -> TaskDB:
     tdb = TaskDB()
     tdb.add_task(task)
     return tdb
+
+
+def hotpotqa() -> TaskDB:
+    """Extract HotpotQA SOTA tables."""
+    return parse(fetch())
@@ -1,3 +1,8 @@
-__all__ = ["nlp_progress"]
+__all__ = ["VERSION", "fetch", "parse", "nlp_progress"]
 
-from sota_extractor.scrapers.nlp_progress.main import nlp_progress
+from sota_extractor.scrapers.nlp_progress.main import (
+    VERSION,
+    fetch,
+    parse,
+    nlp_progress,
+)
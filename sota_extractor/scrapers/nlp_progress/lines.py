@@ -0,0 +1,196 @@
+"""Line based block parser for the NLP-progress markdown files.
+
+NLP-progress files consist almost entirely of headings, paragraphs and pipe
+tables. The `LineParser` recognizes those directly from the lines of every
+block and builds the same element tree as python-markdown would, leaving only
+the remaining blocks (lists, code, quotes, ...) to the python-markdown block
+processors.
+
+Text that contains no inline markup other than plain links is converted into
+elements directly as well, and marked atomic, so the python-markdown inline
+processor only needs to handle the rest.
+"""
+
+import re
+from typing import List, Optional
+from xml.etree import ElementTree as etree
+
+import markdown
+from markdown.util import AtomicString
+from markdown.blockprocessors import HashHeaderProcessor, ParagraphProcessor
+from markdown.extensions.tables import TableProcessor
+
+# Characters that can start an inline pattern, the placeholder markers and
+# the markdown line break.
+INLINE_MARKUP = re.compile(r"[\\`*_<&\[\x02\x03]|  \n")
+
+# A link without a title, nested markup or characters that would need
+# escaping in its url.
+LINK = re.compile(
+    r"\[([^\\`*_<&\[\]\x02\x03]*)\]\(([^\s()<>\"'\\`\x02\x03]+)\)"
+)
+
+
+class LineParser:
+    """Parse the blocks of a markdown document.
+
+    Args:
+        md (markdown.Markdown): Markdown instance whose block processors and
+            inline processor handle the content the parser doesn't convert.
+    """
+
+    def __init__(self, md: markdown.Markdown):
+        self.md = md
+        # Top level elements with content left to the inline processor
+        self.pending = []
+
+    def parse_document(self, lines: List[str]) -> etree.Element:
+        """Parse preprocessed lines into an element tree.
+
+        Unlike the python-markdown block parser, the returned tree already
+        has its inline content processed.
+
+        Args:
+            lines (List[str]): Lines of the document.
+
+        Returns:
+            etree.Element: Root element of the tree.
+        """
+        root = etree.Element(self.md.doc_tag)
+        self.pending = []
+        for block in "\n".join(lines).split("\n\n"):
+            self.parse_block(root, block)
+
+        if self.pending:
+            # The elements without pending content would only be traversed,
+            # so leaving them out keeps the order in which the inline
+            # processor handles the rest.
+            pending = set(self.pending)
+            subtree = etree.Element(self.md.doc_tag)
+            subtree.extend(el for el in root if el in pending)
+            self.md.treeprocessors["inline"].run(subtree)
+        return root
+
+    def parse_block(self, parent: etree.Element, block: str):
+        """Parse a block and append the elements it consists of to parent."""
+        # Find the block processor python-markdown would use.
+        for processor in self.md.parser.blockprocessors:
+            if processor.test(parent, block):
+                break
+
+        if isinstance(processor, ParagraphProcessor):
+            if block.strip():
+                p = etree.SubElement(parent, "p")
+                p.text = block.lstrip()
+                self.inline(p, p)
+        elif isinstance(processor, HashHeaderProcessor):
+            m = processor.RE.search(block)
+            before = block[: m.start()]
+            after = block[m.end() :]
+            if before:
+                self.parse_block(parent, before)
+            h = etree.SubElement(parent, "h%d" % len(m.group("level")))
+            h.text = m.group("header").strip()
+            self.inline(h, h)
+            if after:
+                self.parse_block(parent, after)
+        elif (
+            isinstance(processor, TableProcessor)
+            and "`" not in block
+            and "\\" not in block
+        ):
+            self.parse_table(parent, block, processor)
+        else:
+            # The block processors may also extend the last element.
+            n_elements = max(len(parent) - 1, 0)
+            self.md.parser.parseBlocks(parent, [block])
+            self.pending.extend(parent[n_elements:])
+
+    def parse_table(
+        self, parent: etree.Element, block: str, processor: TableProcessor
+    ):
+        """Build a table from a block without code or escapes.
+
+        Args:
+            parent (etree.Element): Parent element.
+            block (str): Block for which `processor.test` succeeded.
+            processor (TableProcessor): Table processor holding the border and
+                the separator row of the table.
+        """
+        rows = block.split("\n")
+        n_columns = len(processor.separator)
+
+        table = etree.SubElement(parent, "table")
+        thead = etree.SubElement(table, "thead")
+        self.parse_row(
+            table, thead, "th", rows[0], processor.border, n_columns
+        )
+        tbody = etree.SubElement(table, "tbody")
+        if len(rows) < 3:
+            # Table without rows
+            tr = etree.SubElement(tbody, "tr")
+            for _ in range(n_columns):
+                etree.SubElement(tr, "td")
+        for row in rows[2:]:
+            self.parse_row(
+                table, tbody, "td", row, processor.border, n_columns
+            )
+
+    def parse_row(
+        self,
+        table: etree.Element,
+        parent: etree.Element,
+        tag: str,
+        row: str,
+        border: bool,
+        n_columns: int,
+    ):
+        """Build a table row with a cell for each column."""
+        row = row.strip(" ")
+        if border:
+            if row.startswith("|"):
+                row = row[1:]
+            if row.endswith("|"):
+                row = row[:-1]
+        cells = row.split("|")
+
+        tr = etree.SubElement(parent, "tr")
+        for i in range(n_columns):
+            c = etree.SubElement(tr, tag)
+            c.text = cells[i].strip(" ") if i < len(cells) else ""
+            self.inline(table, c)
+
+    def inline(self, top: etree.Element, el: etree.Element):
+        """Convert the inline content if it's plain text or plain links.
+
+        The converted text is marked atomic, otherwise the top level element
+        containing the element is left to the python-markdown inline
+        processor.
+        """
+        text = el.text
+        if not text:
+            return
+
+        if INLINE_MARKUP.search(text) is None:
+            el.text = AtomicString(text)
+            return
+
+        pieces = LINK.split(text)
+        # Split returns the text around the links, the link text and the url.
+        for i in range(0, len(pieces), 3):
+            if INLINE_MARKUP.search(pieces[i]) is not None:
+                if not self.pending or self.pending[-1] is not top:
+                    self.pending.append(top)
+                return
+
+        el.text = atomic(pieces[0])
+        for i in range(1, len(pieces), 3):
+            a = etree.SubElement(el, "a")
+            a.text = AtomicString(pieces[i])
+            a.set("href", pieces[i + 1])
+            a.tail = atomic(pieces[i + 2])
+
+
+def atomic(text: str) -> Optional[AtomicString]:
+    """Mark the text atomic, python-markdown leaves empty text unset."""
+    return AtomicString(text) if text else None
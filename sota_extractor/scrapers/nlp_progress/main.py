@@ -1,43 +1,206 @@
+import io
 import os
 import glob
+import shutil
+import hashlib
+import functools
 import logging
 import tempfile
 import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 
 from sota_extractor.errors import DataError
 from sota_extractor.taskdb.v01 import TaskDB
-from sota_extractor.consts import NLP_PROGRESS_REPO
-from sota_extractor.scrapers.nlp_progress.markdown import parse_file
+from sota_extractor.consts import (
+    NLP_PROGRESS_REPO,
+    NLP_PROGRESS_WORKERS,
+    NLP_PROGRESS_LINE_PARSER,
+)
+from sota_extractor.scrapers import client
+from sota_extractor.scrapers.cache import TaskDBCache
+from sota_extractor.scrapers.nlp_progress.markdown import parse_string
 
 logger = logging.getLogger(__name__)
 
+VERSION = 1
 
-def nlp_progress() -> TaskDB:
-    """Parse a the whole nlp progress repo or a single markdown file.
 
-    Checkouts the nlp progress git repository and parses all the markdown files
-    in it.
+def git(args: List[str], cwd: Optional[str] = None) -> bool:
+    """Run a git command and log its output if it fails."""
+    cp = subprocess.run(["git", *args], cwd=cwd, capture_output=True)
+    if cp.returncode != 0:
+        logger.error("git %s", " ".join(args))
+        logger.error("stdout: %s", cp.stdout)
+        logger.error("stderr: %s", cp.stderr)
+        return False
+    return True
+
+
+def clone(repo_path: str):
+    """Clone the nlp progress git repository."""
+    if not git(["clone", "--quiet", NLP_PROGRESS_REPO, repo_path]):
+        raise DataError("Could not clone the NLP Progress repository.")
+
+
+def update(repo_path: str) -> bool:
+    """Fetch only the new commits into an existing clone and check them out.
 
     Returns:
-        TaskDB: Populated task database.
+        bool: False if the clone could not be updated.
     """
-    tdb = TaskDB()
+    if not os.path.isdir(os.path.join(repo_path, ".git")):
+        return False
+    return git(
+        ["fetch", "--quiet", NLP_PROGRESS_REPO, "HEAD"], cwd=repo_path
+    ) and git(["reset", "--quiet", "--hard", "FETCH_HEAD"], cwd=repo_path)
+
+
+def read_files(repo_path: str) -> Dict[str, str]:
+    """Read the english markdown files of a checkout.
+
+    Returns:
+        Dict[str, str]: Mapping from the path of every english markdown file,
+            relative to the repository root, to its content.
+    """
+    payload = {}
+    for filename in glob.glob(os.path.join(repo_path, "english", "*.md")):
+        # Keep the line endings so the content matches the git blob.
+        with io.open(filename, mode="r", encoding="utf-8", newline="") as f:
+            payload[os.path.relpath(filename, repo_path)] = f.read()
+    return payload
+
+
+def checkout() -> Dict[str, str]:
+    """Checkout the nlp progress git repository and read its files.
+
+    If a cache directory is configured, the repository is kept there between
+    the runs and only the new commits are fetched. Otherwise the repository
+    is cloned into a temporary directory.
+    """
+    cache_dir = client.get_client().cache_dir
+    if cache_dir is None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = os.path.join(tmpdir, "nlp-progress")
+            clone(repo_path)
+            return read_files(repo_path)
+
+    repo_path = os.path.join(cache_dir, "nlp-progress")
+    if not update(repo_path):
+        shutil.rmtree(repo_path, ignore_errors=True)
+        clone(repo_path)
+    return read_files(repo_path)
+
+
+def fetch() -> Dict[str, str]:
+    """Fetch the english markdown files of the nlp progress repository."""
+    return client.get_documents(NLP_PROGRESS_REPO, checkout)
+
+
+def blob_sha(content: str) -> str:
+    """Compute the git blob SHA of a file content."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0%s" % (len(data), data)).hexdigest()
+
+
+def parse_strings(
+    texts: List[str], workers: int, line_parser: bool = False
+) -> List[TaskDB]:
+    """Parse markdown strings, in parallel if more than one worker is used.
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = os.path.join(tmpdir, "nlp-progress")
-        cp = subprocess.run(
-            ["git", "clone", NLP_PROGRESS_REPO, repo_path], capture_output=True
-        )
-        if cp.returncode != 0:
-            logger.error("stdout: %s", cp.stdout)
-            logger.error("stderr: %s", cp.stderr)
-            raise DataError("Could not clone the NLP Progress repository.")
+    Args:
+        texts (List[str]): Markdown strings.
+        workers (int): Number of worker processes.
+        line_parser (bool): Use the line based parser.
 
-        filenames = glob.glob(os.path.join(repo_path, "english", "*.md"))
+    Returns:
+        List[TaskDB]: Task databases in the order of the strings.
+    """
+    parse_text = functools.partial(parse_string, line_parser=line_parser)
+    workers = min(workers, len(texts))
+    if workers <= 1:
+        return [parse_text(text) for text in texts]
+
+    # Spawn the workers instead of forking, the scrapers may run in threads.
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(executor.map(parse_text, texts))
+
+
+def parse(
+    payload: Dict[str, str],
+    workers: Optional[int] = None,
+    line_parser: Optional[bool] = None,
+) -> TaskDB:
+    """Parse the markdown files fetched by `fetch`.
+
+    Files are parsed across a pool of processes and merged in the order of
+    the payload, so the output does not depend on the number of workers.
+
+    If a cache directory is configured, the parsed files are cached by their
+    git blob SHA, so only the files that changed since the last run are
+    parsed again.
+
+    Args:
+        payload (Dict[str, str]): Mapping from file paths to their content.
+        workers (int, optional): Number of worker processes, defaults to
+            `NLP_PROGRESS_WORKERS`.
+        line_parser (bool, optional): Use the line based parser, defaults to
+            `NLP_PROGRESS_LINE_PARSER`.
+
+    Returns:
+        TaskDB: Populated task database.
+    """
+    if workers is None:
+        workers = NLP_PROGRESS_WORKERS
+    if line_parser is None:
+        line_parser = NLP_PROGRESS_LINE_PARSER
+
+    cache_dir = client.get_client().cache_dir
+    cache = (
+        TaskDBCache(os.path.join(cache_dir, "nlp-progress-files"))
+        if cache_dir is not None
+        else None
+    )
 
+    filenames = list(payload)
+    parsed = {}
+    if cache is not None:
+        keys = {
+            filename: f"{blob_sha(payload[filename])}-{VERSION}"
+            + ("-lines" if line_parser else "")
+            for filename in filenames
+        }
         for filename in filenames:
-            file_tdb = parse_file(filename)
-            for task in file_tdb.tasks.values():
-                tdb.add_task(task)
+            file_tdb = cache.load(keys[filename])
+            if file_tdb is not None:
+                parsed[filename] = file_tdb
 
+    missing = [filename for filename in filenames if filename not in parsed]
+    file_tdbs = parse_strings(
+        [payload[f] for f in missing], workers=workers, line_parser=line_parser
+    )
+    for filename, file_tdb in zip(missing, file_tdbs):
+        parsed[filename] = file_tdb
+        if cache is not None:
+            cache.store(keys[filename], file_tdb)
+
+    tdb = TaskDB()
+    for filename in filenames:
+        for task in parsed[filename].tasks.values():
+            tdb.add_task(task)
     return tdb
+
+
+def nlp_progress() -> TaskDB:
+    """Parse a the whole nlp progress repo or a single markdown file.
+
+    Checkouts the nlp progress git repository and parses all the markdown files
+    in it.
+
+    Returns:
+        TaskDB: Populated task database.
+    """
+    return parse(fetch())
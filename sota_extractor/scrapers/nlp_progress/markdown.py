@@ -8,13 +8,13 @@ from markdown.extensions.tables import TableExtension
 
 from sota_extractor.taskdb.v01 import Task, Dataset, TaskDB
 from sota_extractor.scrapers.nlp_progress.fixer import fix_task
+from sota_extractor.scrapers.nlp_progress.lines import LineParser
 from sota_extractor.scrapers.nlp_progress.parsers import (
     Text,
     parse_sota,
     parse_subdatasets,
 )
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -160,15 +160,61 @@ class Markdown(markdown.Markdown):
             self.parser_processor, "parser_processor", 1
         )
 
+    def parse(self, source: str, line_parser: bool = False) -> List[Task]:
+        """Parse a markdown document into tasks.
+
+        Unlike `convert`, this stops after the tree processors: the element
+        tree is neither serialized nor passed through the postprocessors.
+
+        Args:
+            source (str): Markdown document.
+            line_parser (bool): Use the `LineParser` instead of the
+                python-markdown block parser.
+
+        Returns:
+            List[Task]: Parsed tasks.
+        """
+        if not source.strip():
+            return []
+
+        self.lines = source.split("\n")
+        for preprocessor in self.preprocessors:
+            self.lines = preprocessor.run(self.lines)
+
+        if line_parser:
+            root = LineParser(self).parse_document(self.lines)
+        else:
+            root = self.parser.parseDocument(self.lines).getroot()
+        for treeprocessor in self.treeprocessors:
+            if line_parser and treeprocessor is self.treeprocessors["inline"]:
+                # Already applied by the line parser
+                continue
+            new_root = treeprocessor.run(root)
+            if new_root is not None:
+                root = new_root
+        return self.parser_processor.parsed
 
-def parse_file(filename: str) -> TaskDB:
-    """Parse an NLP-Progress markdown file and return a TaskDB instance."""
+
+def parse_string(text: str, line_parser: bool = False) -> TaskDB:
+    """Parse an NLP-Progress markdown document and return a TaskDB instance.
+
+    Args:
+        text (str): Markdown document.
+        line_parser (bool): Use the faster line based parser.
+
+    Returns:
+        TaskDB: Populated task database.
+    """
     md = Markdown()
-    with io.open("/dev/null", "wb") as f:
-        md.convertFile(filename, output=f)
 
     tdb = TaskDB()
-    for task in md.parser_processor.parsed:
+    for task in md.parse(text.lstrip("\ufeff"), line_parser=line_parser):
         for t in fix_task(task):
             tdb.add_task(t)
     return tdb
+
+
+def parse_file(filename: str, line_parser: bool = False) -> TaskDB:
+    """Parse an NLP-Progress markdown file and return a TaskDB instance."""
+    with io.open(filename, mode="r", encoding="utf-8") as f:
+        return parse_string(f.read(), line_parser=line_parser)
@@ -1,13 +1,16 @@
 import re
 import logging
+import functools
 from xml.etree.ElementTree import ElementTree
 from typing import Optional, List, Union, Tuple
 
 from sota_extractor.taskdb.v01 import Sota, SotaRow, Dataset, Link
 
-
 logger = logging.getLogger(__name__)
 
+# Maximal number of parsed model cells kept in memory.
+MODEL_CACHE_SIZE = 4096
+
 
 def nlp_progress_link() -> Link:
     return Link(
@@ -29,6 +32,10 @@ class Model:
         """,
         re.VERBOSE | re.UNICODE,
     )
+    WHITESPACE = re.compile(r"\s+")
+    ADDITIONAL_DATA = re.compile(
+        "with additional unlabeled data", re.IGNORECASE
+    )
 
     def __init__(
         self,
@@ -43,18 +50,21 @@ class Model:
     @staticmethod
     def _ws(s: str) -> str:
         """Normalize whitespace."""
-        return re.sub(r"\s+", " ", s).strip()
+        return Model.WHITESPACE.sub(" ", s).strip()
 
     @classmethod
+    @functools.lru_cache(maxsize=MODEL_CACHE_SIZE)
     def parse(cls, s: str) -> Optional["Model"]:
+        """Parse a model cell.
+
+        The same models appear in many tables, so the parsed cells are cached
+        and the returned instances must not be modified. Hits and misses of
+        the cache are reported by `Model.parse.cache_info()`.
+        """
         s = cls._ws(s)
         if "with additional unlabeled data" in s.lower():
             uses_additional_data = True
-            s = cls._ws(
-                re.sub(
-                    "with additional unlabeled data", "", s, 1, re.IGNORECASE
-                )
-            )
+            s = cls._ws(cls.ADDITIONAL_DATA.sub("", s, 1))
         else:
             uses_additional_data = False
 
@@ -84,27 +94,30 @@ class Text:
         self.links = links or []
 
     @classmethod
-    def _unwind(cls, el: ElementTree, keep_links) -> "Text":
-        start = el.text or ""
+    def _unwind(
+        cls,
+        el: ElementTree,
+        keep_links: bool,
+        fragments: List[str],
+        links: List[Link],
+    ):
+        """Append the text and the links of the element and its tail."""
         if el.tag == "a":
-            links = [Link(title=el.text, url=el.attrib.get("href", None))]
-        else:
-            links = []
+            links.append(Link(title=el.text, url=el.attrib.get("href", None)))
+            if keep_links:
+                fragments.append(
+                    f"[{el.text or ''}]({el.attrib.get('href', '')})"
+                )
+            elif el.text:
+                fragments.append(el.text)
+        elif el.text:
+            fragments.append(el.text)
 
-        children = ""
         for child in el:
-            t = cls._unwind(child, keep_links=keep_links)
-            children += t.text
-            links.extend(t.links)
+            cls._unwind(child, keep_links, fragments, links)
 
-        end = el.tail or ""
-
-        if el.tag == "a" and keep_links:
-            return cls(
-                text=f"[{start}]({el.attrib.get('href', '')}){children}{end}",
-                links=links,
-            )
-        return cls(text=start + children + end, links=links)
+        if el.tail:
+            fragments.append(el.tail)
 
     @classmethod
     def parse(
@@ -112,12 +125,11 @@ class Text:
     ) -> "Text":
         if isinstance(elements, ElementTree):
             elements = [elements]
-        text = cls()
+        fragments = []
+        links = []
         for el in elements:
-            t = cls._unwind(el, keep_links=keep_links)
-            text.text += t.text
-            text.links.extend(t.links)
-        return text
+            cls._unwind(el, keep_links, fragments, links)
+        return cls(text="".join(fragments), links=links)
 
 
 def parse_sota(table: ElementTree) -> Sota:
@@ -125,7 +137,7 @@ def parse_sota(table: ElementTree) -> Sota:
         (header.text or "").strip() for header in table.findall("thead/tr/th")
     ]
     headers_sanitized = [
-        re.sub(r"\s+", "", header.lower()) for header in headers
+        Model.WHITESPACE.sub("", header.lower()) for header in headers
     ]
 
     if "model" in headers_sanitized:
@@ -1,7 +1,10 @@
+import re
 import logging
 from datetime import datetime
+from typing import Dict
 
-from sota_extractor.scrapers.utils import get_soup
+from bs4 import BeautifulSoup, Tag
+from sota_extractor.scrapers.utils import fetch_texts
 from sota_extractor.taskdb.v01 import (
     Link,
     Task,
@@ -13,6 +16,7 @@ from sota_extractor.taskdb.v01 import (
 
 logger = logging.getLogger(__name__)
 
+VERSION = 1
 
 DATA = [
     {
@@ -46,7 +50,28 @@ DATA = [
 ]
 
 
-def get_sota_rows(url: str, dataset: Dataset):
+LEADERBOARD_ID_PREFIX = "leaderboard-for-"
+
+
+def get_leaderboards(page: str) -> Dict[str, Tag]:
+    """Parse a leaderboard page and find all of its leaderboard tables.
+
+    Returns:
+        Dict[str, Tag]: Mapping from the lowercase dataset name to its table.
+    """
+    soup = BeautifulSoup(page, "lxml")
+    leaderboards = {}
+    for heading in soup.find_all(
+        id=re.compile(f"^{re.escape(LEADERBOARD_ID_PREFIX)}")
+    ):
+        table = heading.find_next_sibling("table")
+        if table is not None:
+            name = heading["id"][len(LEADERBOARD_ID_PREFIX) :]
+            leaderboards.setdefault(name, table)
+    return leaderboards
+
+
+def get_sota_rows(table: Tag, dataset: Dataset):
     paper_code_col = 6
     date_col = 9
     params_col = 7
@@ -54,11 +79,6 @@ def get_sota_rows(url: str, dataset: Dataset):
     metric_2_col = 3
     metric_4_col = 4
     try:
-        soup = get_soup(url)
-
-        h3 = soup.find(id=f"leaderboard-for-{dataset.name}".lower())
-        table = h3.find_next_sibling("table")
-
         headers = table.find_all("th")
         metric_1 = headers[metric_1_col].text
         metric_2 = headers[metric_2_col].text
@@ -70,7 +90,9 @@ def get_sota_rows(url: str, dataset: Dataset):
             tds = tr.find_all("td")
 
             try:
-                paper_url = tds[paper_code_col].find("a", text="Paper").attrs["href"]
+                paper_url = (
+                    tds[paper_code_col].find("a", text="Paper").attrs["href"]
+                )
             except (AttributeError, KeyError):
                 paper_url = ""
 
@@ -80,8 +102,8 @@ def get_sota_rows(url: str, dataset: Dataset):
                 paper_date = None
 
             try:
-                link = Link(url=tds[paper_code_col].find("a", text="Code").attrs["href"])
-                code_links = [link]
+                code = tds[paper_code_col].find("a", text="Code")
+                code_links = [Link(url=code.attrs["href"])]
             except (AttributeError, KeyError):
                 code_links = []
 
@@ -105,12 +127,22 @@ def get_sota_rows(url: str, dataset: Dataset):
         )
 
 
-def ogb() -> TaskDB:
-    """Extract OGB SOTA tables."""
+def fetch() -> Dict[str, str]:
+    """Fetch the raw OGB leaderboard pages."""
+    return fetch_texts([item["url"] for item in DATA])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the OGB leaderboard pages fetched by `fetch`.
+
+    Every page is parsed only once and the tables of all its datasets are
+    extracted from the same tree.
+    """
     tdb = TaskDB()
 
     for item in DATA:
         url = item["url"]
+        leaderboards = get_leaderboards(payload[url])
 
         task = Task(
             name=item["task"],
@@ -120,5 +152,14 @@ def ogb() -> TaskDB:
         for dataset_name in item["datasets"]:
             dataset = Dataset(name=dataset_name)
             task.datasets.append(dataset)
-            get_sota_rows(url, dataset)
+            table = leaderboards.get(dataset_name.lower())
+            if table is None:
+                logger.error("Failed to get dataset: %s", dataset_name)
+                continue
+            get_sota_rows(table, dataset)
     return tdb
+
+
+def ogb() -> TaskDB:
+    """Extract OGB SOTA tables."""
+    return parse(fetch())
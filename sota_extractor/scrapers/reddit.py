@@ -1,6 +1,8 @@
 import re
-import requests
+from typing import Dict
+
 from bs4 import BeautifulSoup
+from sota_extractor.scrapers.utils import fetch_texts
 from sota_extractor.taskdb.v01 import (
     Task,
     Dataset,
@@ -10,16 +12,23 @@ from sota_extractor.taskdb.v01 import (
     TaskDB,
 )
 
+VERSION = 1
+
 REDITSOTA_URL = (
     "https://raw.githubusercontent.com/RedditSota/"
     "state-of-the-art-result-for-machine-learning-problems/master/README.md"
 )
 
 
-def reddit() -> TaskDB:
-    """Extract Reddit SOTA tables."""
+def fetch() -> Dict[str, str]:
+    """Fetch the raw RedditSota README."""
+    return fetch_texts([REDITSOTA_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the RedditSota README fetched by `fetch`."""
     tdb = TaskDB()
-    md = requests.get(REDITSOTA_URL).text
+    md = payload[REDITSOTA_URL]
 
     # assumptions:
     # ### Category
@@ -165,3 +174,8 @@ def reddit() -> TaskDB:
                 task = None
 
     return tdb
+
+
+def reddit() -> TaskDB:
+    """Extract Reddit SOTA tables."""
+    return parse(fetch())
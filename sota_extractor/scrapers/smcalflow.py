@@ -1,10 +1,16 @@
-import requests
+from typing import Dict
 
-from sota_extractor.errors import HttpClientError
-from sota_extractor.scrapers.utils import date_from_timestamp
+from sota_extractor.scrapers.utils import (
+    date_from_timestamp,
+    fetch_texts,
+    load_json,
+)
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
 
 
+VERSION = 1
+
+
 URL = (
     "https://microsoft.github.io/task_oriented_dialogue_as_dataflow_synthesis/"
 )
@@ -59,12 +65,14 @@ def get_sota_rows(data):
     return sota_rows
 
 
-def smcalflow() -> TaskDB:
-    """Extract SMCalFlow SOTA tables."""
-    try:
-        data = requests.get(JSON_URL).json()
-    except Exception as e:
-        raise HttpClientError(message=str(e))
+def fetch() -> Dict[str, str]:
+    """Fetch the raw SMCalFlow leaderboard."""
+    return fetch_texts([JSON_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the SMCalFlow leaderboard fetched by `fetch`."""
+    data = load_json(payload[JSON_URL])
 
     dataset = Dataset(name=DATASET_NAME, is_subdataset=False)
     task = Task(name=TASK_NAME)
@@ -79,3 +87,8 @@ def smcalflow() -> TaskDB:
     tdb = TaskDB()
     tdb.add_task(task)
     return tdb
+
+
+def smcalflow() -> TaskDB:
+    """Extract SMCalFlow SOTA tables."""
+    return parse(fetch())
@@ -1,4 +1,7 @@
-from sota_extractor.scrapers.utils import get_soup
+from typing import Dict
+
+from bs4 import BeautifulSoup
+from sota_extractor.scrapers.utils import fetch_texts
 from sota_extractor.taskdb.v01 import (
     Link,
     Task,
@@ -8,12 +11,19 @@ from sota_extractor.taskdb.v01 import (
     TaskDB,
 )
 
+VERSION = 1
+
 SNLI_URL = "https://nlp.stanford.edu/projects/snli/"
 
 
-def snli() -> TaskDB:
-    """Extract SNLI SOTA tables."""
-    soup = get_soup(SNLI_URL)
+def fetch() -> Dict[str, str]:
+    """Fetch the raw SNLI project page."""
+    return fetch_texts([SNLI_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the SNLI project page fetched by `fetch`."""
+    soup = BeautifulSoup(payload[SNLI_URL], "lxml")
 
     table = soup.findAll("table", attrs={"class": "newstuff"})[1]
 
@@ -109,3 +119,8 @@ def snli() -> TaskDB:
     tdb = TaskDB()
     tdb.add_task(task)
     return tdb
+
+
+def snli() -> TaskDB:
+    """Extract SNLI SOTA tables."""
+    return parse(fetch())
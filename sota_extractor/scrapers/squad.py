@@ -1,12 +1,18 @@
 import re
+from typing import Dict
 
-import requests
-
-from sota_extractor.errors import HttpClientError
-from sota_extractor.scrapers.utils import date_from_timestamp, sround
+from sota_extractor.scrapers.utils import (
+    date_from_timestamp,
+    fetch_texts,
+    load_json,
+    sround,
+)
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
 
 
+VERSION = 1
+
+
 SQUAD_URL = "https://rajpurkar.github.io/SQuAD-explorer/"
 SQUAD_MASTER_URL = (
     "https://raw.githubusercontent.com/rajpurkar/SQuAD-explorer/master"
@@ -83,13 +89,15 @@ def get_sota_rows(data):
     return sota_rows
 
 
-def squad() -> TaskDB:
-    """Extract SQUAD SOTA tables."""
-    try:
-        squad_1 = requests.get(SQUAD_1_1_JSON_URL).json()
-        squad_2 = requests.get(SQUAD_2_0_JSON_URL).json()
-    except Exception as e:
-        raise HttpClientError(message=str(e))
+def fetch() -> Dict[str, str]:
+    """Fetch the raw SQUAD leaderboards."""
+    return fetch_texts([SQUAD_1_1_JSON_URL, SQUAD_2_0_JSON_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the SQUAD leaderboards fetched by `fetch`."""
+    squad_1 = load_json(payload[SQUAD_1_1_JSON_URL])
+    squad_2 = load_json(payload[SQUAD_2_0_JSON_URL])
 
     dataset1 = Dataset(
         name=DATASET_1_NAME,
@@ -115,3 +123,8 @@ def squad() -> TaskDB:
     tdb = TaskDB()
     tdb.add_task(task)
     return tdb
+
+
+def squad() -> TaskDB:
+    """Extract SQUAD SOTA tables."""
+    return parse(fetch())
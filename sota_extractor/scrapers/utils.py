@@ -1,10 +1,14 @@
-import requests
+import json
 from datetime import datetime
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
 
 import pytz
 from bs4 import BeautifulSoup
 
+from sota_extractor.scrapers import client
+from sota_extractor.errors import DataError, HttpClientError
+
 
 def get_soup(url):
     """Get a BeautifulSoup object back from the a URL.
@@ -13,7 +17,7 @@ def get_soup(url):
         url: URL to scrape.
     """
 
-    r = requests.get(url)
+    r = client.get(url)
 
     if r.status_code == 404:
         return None
@@ -22,6 +26,59 @@ def get_soup(url):
     return BeautifulSoup(data, "lxml")
 
 
+def fetch_text(url: str) -> str:
+    """Fetch the text of the URL.
+
+    Raises:
+        HttpClientError: If the request failed or the response status is not
+            successful, so error pages are never parsed or cached.
+    """
+    try:
+        response = client.get(url)
+    except Exception as e:
+        raise HttpClientError(message=str(e))
+    if not 200 <= response.status_code < 300:
+        raise HttpClientError(
+            f"Resource unavailable: {url}", response=response
+        )
+    return response.text
+
+
+def fetch_texts(urls: List[str]) -> Dict[str, str]:
+    """Fetch the text of every URL concurrently.
+
+    Args:
+        urls: URLs to fetch.
+
+    Returns:
+        Dict[str, str]: Mapping from the URL to the response text.
+
+    Raises:
+        HttpClientError: If any of the requests failed.
+    """
+    if not urls:
+        return {}
+    if len(urls) == 1:
+        return {urls[0]: fetch_text(urls[0])}
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return dict(zip(urls, executor.map(fetch_text, urls)))
+
+
+def load_json(text: str) -> Any:
+    """Decode a fetched json document.
+
+    Args:
+        text: Json document.
+
+    Raises:
+        DataError: If the document is not valid json.
+    """
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        raise DataError(f"Invalid json document: {e}")
+
+
 def date_from_timestamp(
     timestamp: Optional[Union[int, str]], tz: str = "UTC"
 ) -> Optional[datetime]:
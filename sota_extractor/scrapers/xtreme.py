@@ -2,9 +2,9 @@ import re
 import json
 import _jsonnet
 from datetime import datetime
+from typing import Dict
 
-import requests
-
+from sota_extractor.scrapers.utils import fetch_texts
 from sota_extractor.taskdb.v01 import (
     Link,
     Task,
@@ -15,6 +15,8 @@ from sota_extractor.taskdb.v01 import (
 )
 
 
+VERSION = 1
+
 XTREME_URL = "https://sites.research.google/xtreme/app.js"
 
 
@@ -32,9 +34,14 @@ REGEX = re.compile(
 )
 
 
-def xtreme() -> TaskDB:
-    """Extract Xtreme SOTA tables."""
-    data = requests.get(XTREME_URL).text.splitlines()
+def fetch() -> Dict[str, str]:
+    """Fetch the raw Xtreme app.js source."""
+    return fetch_texts([XTREME_URL])
+
+
+def parse(payload: Dict[str, str]) -> TaskDB:
+    """Parse the Xtreme app.js source fetched by `fetch`."""
+    data = payload[XTREME_URL].splitlines()
 
     sota_rows = []
     for line in data:
@@ -102,3 +109,8 @@ def xtreme() -> TaskDB:
     tdb = TaskDB()
     tdb.add_task(task)
     return tdb
+
+
+def xtreme() -> TaskDB:
+    """Extract Xtreme SOTA tables."""
+    return parse(fetch())
@@ -1,17 +1,120 @@
 import io
+import os
+import re
 import json
 import gzip
-from sota_extractor import errors
-from sota_extractor.consts import Format
-from sota_extractor.taskdb import TaskDB
+import codecs
+from typing import Any, Iterable, Iterator, List, TextIO, Union
 
+from sota_extractor import errors, shards
+from sota_extractor.compression import GzipWriter
+from sota_extractor.consts import GZIP_LEVEL, Format
+from sota_extractor.jsonlib import JsonBackend, get_backend
+from sota_extractor.taskdb import Task, TaskDB
+from sota_extractor.taskdb.v01 import decoder
 
-def dumps(tdb: TaskDB) -> str:
+# Number of characters initially read at once by the incremental reader.
+CHUNK_SIZE = 64 * 1024
+
+JSON_DECODER = json.JSONDecoder()
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+JSON_DELIMITERS = {",", "]", " ", "\t", "\n", "\r"}
+
+JSON_FORMATS = (Format.json, Format.json_gz)
+JSONL_FORMATS = (Format.jsonl, Format.jsonl_gz)
+GZIP_FORMATS = (Format.json_gz, Format.jsonl_gz)
+
+
+def infer_format(filename: str) -> Format:
+    """Infer the serialization format from the file extension.
+
+    Directories are assumed to be sharded and files with an unknown
+    extension json.
+    """
+    if os.path.isdir(filename):
+        return Format.shards
+    for fmt in sorted(Format, key=lambda f: len(f.value), reverse=True):
+        if filename.endswith(f".{fmt.value}"):
+            return fmt
+    return Format.json
+
+
+def open_file(
+    filename: str,
+    fmt: Format,
+    mode: str,
+    encoding: str,
+    compresslevel: int = GZIP_LEVEL,
+) -> TextIO:
+    """Open a text file, gzip compressed if the format requires it.
+
+    Gzip files are decompressed while they are read and written with the
+    block-parallel `GzipWriter`.
+    """
+    if fmt not in GZIP_FORMATS:
+        return io.open(filename, mode=mode, encoding=encoding)
+    if mode == "w":
+        return io.TextIOWrapper(
+            GzipWriter(filename, compresslevel=compresslevel),
+            encoding=encoding,
+            newline="",
+        )
+    return gzip.open(filename, mode=f"{mode}t", encoding=encoding)
+
+
+def iterdumps(tdb: TaskDB, backend: str = None) -> Iterator[str]:
+    """Render sota data to json task by task.
+
+    The joined chunks are the same as the whole export rendered with
+    `json.dumps(..., indent=2, sort_keys=True)`, but only a single task is
+    exported and rendered at a time.
+
+    Args:
+        tdb (TaskDB): Populated TaskDB instance.
+        backend (str): JSON backend, see `sota_extractor.jsonlib`.
+
+    Returns:
+        Iterator[str]: Chunks of the json string.
+    """
+    backend = get_backend(backend)
+    empty = True
+    for task in tdb.tasks.values():
+        item = backend.dumps(tdb.schema.dump(task), indent=True)
+        yield "[\n  " if empty else ",\n  "
+        # Strings are escaped, so all the newlines come from the indentation.
+        yield item.replace("\n", "\n  ")
+        empty = False
+    yield "[]" if empty else "\n]"
+
+
+def iterdumps_lines(tdb: TaskDB, backend: str = None) -> Iterator[str]:
+    """Render sota data to json lines, one task per line.
+
+    Args:
+        tdb (TaskDB): Populated TaskDB instance.
+        backend (str): JSON backend, see `sota_extractor.jsonlib`.
+
+    Returns:
+        Iterator[str]: Lines of the rendered tasks.
+    """
+    backend = get_backend(backend)
+    for task in tdb.tasks.values():
+        yield backend.dumps(tdb.schema.dump(task)) + "\n"
+
+
+def dumps(tdb: TaskDB, backend: str = None) -> str:
     """Render sota data to a json string."""
-    return json.dumps(tdb.export(), indent=2, sort_keys=True)
+    return "".join(iterdumps(tdb, backend=backend))
 
 
-def dump(tdb: TaskDB, output: str, fmt=Format.json, encoding="utf-8"):
+def dump(
+    tdb: TaskDB,
+    output: str,
+    fmt=Format.json,
+    encoding="utf-8",
+    backend: str = None,
+    compresslevel: int = GZIP_LEVEL,
+):
     """Write sota data to file.
 
     Intention of this helper function is to always have maximally similar
@@ -24,18 +127,29 @@ def dump(tdb: TaskDB, output: str, fmt=Format.json, encoding="utf-8"):
             serialized.
         fmt (Format): Serialization format.
         encoding (str): File encoding.
+        backend (str): JSON backend, see `sota_extractor.jsonlib`.
+        compresslevel (int): Compression level of the gzip formats.
     """
-    if fmt == Format.json:
-        with io.open(output, mode="w", encoding=encoding) as fp:
-            fp.write(dumps(tdb))
-    elif fmt == Format.json_gz:
-        with gzip.open(output, mode="wb") as fp:
-            fp.write(dumps(tdb).encode(encoding))
+    if fmt in JSON_FORMATS:
+        chunks = iterdumps(tdb, backend=backend)
+    elif fmt in JSONL_FORMATS:
+        chunks = iterdumps_lines(tdb, backend=backend)
+    elif fmt == Format.shards:
+        shards.dump(tdb, output, encoding=encoding, backend=backend)
+        return
     else:
         raise errors.UnsupportedFormat(fmt)
+    with open_file(
+        output,
+        fmt=fmt,
+        mode="w",
+        encoding=encoding,
+        compresslevel=compresslevel,
+    ) as fp:
+        fp.writelines(chunks)
 
 
-def load(filename, fmt=Format.json, encoding="utf-8"):
+def load(filename, fmt=Format.json, encoding="utf-8", backend: str = None):
     """Load sota data from file.
 
     Args:
@@ -43,12 +157,228 @@ def load(filename, fmt=Format.json, encoding="utf-8"):
             deserialized.
         fmt (Format): Serialization format.
         encoding (str): File encoding.
+        backend (str): JSON backend, see `sota_extractor.jsonlib`.
     """
-    if fmt == Format.json:
-        with io.open(filename, mode="r", encoding=encoding) as fp:
-            return json.load(fp)
-    elif fmt == Format.json_gz:
-        with gzip.open(filename, mode="rb") as fp:
-            return json.loads(fp.read().decode(encoding))
+    if fmt in GZIP_FORMATS and fmt in JSON_FORMATS:
+        # Arrays are decoded while decompressing, without keeping the whole
+        # decompressed file in memory.
+        with open_file(filename, fmt=fmt, mode="r", encoding=encoding) as fp:
+            reader = ArrayReader(fp)
+            if reader.skip_whitespace() == "[":
+                return list(reader)
+            return get_backend(backend).loads(reader.buffer + fp.read())
+    elif fmt in JSON_FORMATS:
+        # The backends parse utf-8 encoded bytes directly.
+        with io.open(filename, mode="rb") as fp:
+            data = fp.read()
+        if codecs.lookup(encoding).name != "utf-8":
+            data = data.decode(encoding)
+        return get_backend(backend).loads(data)
+    elif fmt in JSONL_FORMATS or fmt == Format.shards:
+        return list(
+            iter_load(filename, fmt=fmt, encoding=encoding, backend=backend)
+        )
     else:
         raise errors.UnsupportedFormat(fmt)
+
+
+class ArrayReader:
+    """Incremental reader of the items of a top-level json array.
+
+    The file is read in chunks and only the item being decoded is kept in
+    memory. If an item doesn't fit into the buffer, the buffer is grown
+    geometrically, so every item is decoded in linear time.
+
+    Args:
+        fp (TextIO): File object to read from.
+        chunk_size (int): Number of characters initially read at once.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        # Number of characters dropped from the start of the buffer
+        self.offset = 0
+        self.eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.skip_whitespace() != "[":
+            raise self.error("Expecting a json array")
+        self.pos += 1
+        if self.skip_whitespace() == "]":
+            self.pos += 1
+        else:
+            while True:
+                yield self.decode()
+                c = self.skip_whitespace()
+                if c == "]":
+                    self.pos += 1
+                    break
+                if c != ",":
+                    raise self.error("Expecting ',' delimiter")
+                self.pos += 1
+        if self.skip_whitespace() != "":
+            raise self.error("Extra data")
+
+    def read(self) -> bool:
+        """Read more data, returns False at the end of the file."""
+        if self.eof:
+            return False
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :]
+        self.pos = 0
+        chunk = self.fp.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def skip_whitespace(self) -> str:
+        """Skip whitespace, returns the next character or "" at the end."""
+        while True:
+            self.pos = JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read():
+                return ""
+
+    def decode(self) -> Any:
+        """Decode the next value."""
+        while True:
+            self.skip_whitespace()
+            try:
+                value, end = JSON_DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # Reading moves the start of the buffer.
+                error = self.error(e.msg, e.pos)
+                if self.read():
+                    continue
+                raise error
+            # A number not followed by a delimiter may continue in the next
+            # chunk.
+            if (
+                not isinstance(value, (dict, list, str))
+                and self.buffer[end : end + 1] not in JSON_DELIMITERS
+                and self.read()
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def error(self, message: str, pos: int = None) -> errors.DataError:
+        pos = self.pos if pos is None else pos
+        return errors.DataError(f"{message}: character {self.offset + pos}")
+
+
+def iter_lines(fp: TextIO, backend: JsonBackend) -> Iterator[Any]:
+    """Decode the json value on every non-empty line of the file."""
+    for lineno, line in enumerate(fp, start=1):
+        if not line.strip():
+            continue
+        try:
+            value = backend.loads(line)
+        except json.JSONDecodeError as e:
+            raise errors.DataError(f"{e.msg}: line {lineno} column {e.colno}")
+        yield value
+
+
+def iter_load(
+    filename: str,
+    fmt=Format.json,
+    encoding="utf-8",
+    chunk_size: int = CHUNK_SIZE,
+    backend: str = None,
+    tasks: List[str] = None,
+) -> Iterator[Any]:
+    """Load sota data from file incrementally.
+
+    Json files are always decoded with the stdlib decoder, the only one that
+    can decode them incrementally.
+
+    Args:
+        filename (str): Path to the file from which the data should be
+            deserialized.
+        fmt (Format): Serialization format.
+        encoding (str): File encoding.
+        chunk_size (int): Number of characters initially read at once.
+        backend (str): JSON backend decoding json lines files and shards,
+            see `sota_extractor.jsonlib`.
+        tasks (List[str]): Names of the top-level tasks to load, all of them
+            by default. Only the shards of these tasks are read, the other
+            formats are read whole and filtered.
+
+    Returns:
+        Iterator[Any]: Items of the top-level json array, the values on the
+            lines of json lines files or the shards, dictionaries
+            representing tasks.
+    """
+    if fmt == Format.shards:
+        yield from shards.iter_load(
+            filename, encoding=encoding, backend=backend, tasks=tasks
+        )
+        return
+    if fmt not in JSON_FORMATS and fmt not in JSONL_FORMATS:
+        raise errors.UnsupportedFormat(fmt)
+    with open_file(filename, fmt=fmt, mode="r", encoding=encoding) as fp:
+        if fmt in JSONL_FORMATS:
+            values = iter_lines(fp, get_backend(backend))
+        else:
+            values = ArrayReader(fp, chunk_size=chunk_size)
+        yield from select_tasks(values, tasks)
+
+
+def select_tasks(
+    values: Iterable[Any], tasks: List[str] = None
+) -> Iterator[Any]:
+    """Select the dictionaries representing the named top-level tasks.
+
+    Args:
+        values (Iterable[Any]): Dictionaries representing tasks.
+        tasks (List[str]): Names of the tasks to select, all the values are
+            selected if not set.
+    """
+    if tasks is None:
+        yield from values
+        return
+    tasks = set(tasks)
+    for value in values:
+        if isinstance(value, dict) and value.get("task") in tasks:
+            yield value
+
+
+def iter_tasks(
+    filename: str,
+    fmt=Format.json,
+    encoding="utf-8",
+    raw: bool = False,
+    backend: str = None,
+    tasks: List[str] = None,
+) -> Iterator[Union[Task, Any]]:
+    """Load tasks from file one by one.
+
+    Args:
+        filename (str): Path to the file from which the tasks should be
+            loaded.
+        fmt (Format): Serialization format.
+        encoding (str): File encoding.
+        raw (bool): Yield dictionaries representing the tasks instead of
+            tasks.
+        backend (str): JSON backend decoding json lines files and shards,
+            see `sota_extractor.jsonlib`.
+        tasks (List[str]): Names of the top-level tasks to load, all of them
+            by default.
+
+    Returns:
+        Iterator[Task | Dict]: Tasks. Invalid tasks are skipped and
+            `marshmallow.ValidationError` with the errors of all of them is
+            raised after the last task.
+    """
+    data = iter_load(
+        filename, fmt=fmt, encoding=encoding, backend=backend, tasks=tasks
+    )
+    if raw:
+        return data
+    return decoder.iter_tasks(data)
@@ -0,0 +1,146 @@
+"""Sharded directory format.
+
+Every top-level task is stored in its own json file and a manifest lists the
+files in the order of the tasks:
+
+    eff.shards/
+        manifest.json
+        image-classification-1a2b3c4d.json
+        ...
+
+Only the shards whose content changed are written, so the changes of the
+files are proportional to the changes of the tasks, and only the shards of
+the selected tasks are read when loading some of the tasks.
+"""
+
+import io
+import os
+import re
+import codecs
+import hashlib
+from typing import Any, Dict, Iterator, List, Optional
+
+from sota_extractor import errors
+from sota_extractor.jsonlib import get_backend
+from sota_extractor.files import write_changed
+from sota_extractor.taskdb import TaskDB
+
+MANIFEST = "manifest.json"
+VERSION = 1
+
+
+def shard_filename(name: str) -> str:
+    """Get the name of the shard file of a task.
+
+    The names are readable, safe on all platforms and unique for every task
+    name.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:64]
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}.json" if slug else f"{digest}.json"
+
+
+def read_manifest(
+    directory: str, encoding="utf-8", backend: str = None
+) -> Optional[Dict[str, Any]]:
+    """Read the manifest of a sharded directory, None if it doesn't exist."""
+    try:
+        with io.open(os.path.join(directory, MANIFEST), mode="rb") as fp:
+            data = fp.read()
+    except FileNotFoundError:
+        return None
+    manifest = loads(data, encoding, backend)
+    if manifest.get("version") != VERSION:
+        raise errors.DataError(
+            f"Unsupported shards version: {manifest.get('version')}"
+        )
+    return manifest
+
+
+def loads(data: bytes, encoding: str, backend: str = None) -> Any:
+    if codecs.lookup(encoding).name != "utf-8":
+        data = data.decode(encoding)
+    return get_backend(backend).loads(data)
+
+
+def dump(
+    tdb: TaskDB, directory: str, encoding="utf-8", backend: str = None
+) -> List[str]:
+    """Write sota data to a sharded directory.
+
+    Shards that didn't change are not written and the shards of the tasks
+    removed since the last dump are deleted.
+
+    Args:
+        tdb (TaskDB): Populated TaskDB instance.
+        directory (str): Path to the output directory, created if missing.
+        encoding (str): File encoding.
+        backend (str): JSON backend, see `sota_extractor.jsonlib`.
+
+    Returns:
+        List[str]: Paths to the written files.
+    """
+    os.makedirs(directory, exist_ok=True)
+    previous = read_manifest(directory, encoding=encoding, backend=backend)
+    backend = get_backend(backend)
+
+    written = []
+    entries = []
+    for task in tdb.tasks.values():
+        entry = {"file": shard_filename(task.name), "task": task.name}
+        entries.append(entry)
+        filename = os.path.join(directory, entry["file"])
+        data = backend.dumps(tdb.schema.dump(task), indent=True)
+        if write_changed(filename, data.encode(encoding)):
+            written.append(filename)
+
+    filename = os.path.join(directory, MANIFEST)
+    data = backend.dumps({"tasks": entries, "version": VERSION}, indent=True)
+    if write_changed(filename, data.encode(encoding)):
+        written.append(filename)
+
+    if previous is not None:
+        files = {entry["file"] for entry in entries}
+        for entry in previous["tasks"]:
+            if entry["file"] not in files:
+                try:
+                    os.remove(os.path.join(directory, entry["file"]))
+                except FileNotFoundError:
+                    pass
+    return written
+
+
+def iter_load(
+    directory: str,
+    encoding="utf-8",
+    backend: str = None,
+    tasks: List[str] = None,
+) -> Iterator[Any]:
+    """Load sota data from a sharded directory.
+
+    The shards are read one by one, only the shards of the selected tasks are
+    opened.
+
+    Args:
+        directory (str): Path to the sharded directory.
+        encoding (str): File encoding.
+        backend (str): JSON backend, see `sota_extractor.jsonlib`.
+        tasks (List[str]): Names of the top-level tasks to load, all of them
+            by default.
+
+    Returns:
+        Iterator[Any]: Dictionaries representing the tasks, in the order in
+            which they were dumped.
+    """
+    manifest = read_manifest(directory, encoding=encoding, backend=backend)
+    if manifest is None:
+        raise errors.DataError(f"Missing {MANIFEST} in {directory}")
+
+    entries = manifest["tasks"]
+    if tasks is not None:
+        tasks = set(tasks)
+        entries = [entry for entry in entries if entry["task"] in tasks]
+
+    for entry in entries:
+        with io.open(os.path.join(directory, entry["file"]), mode="rb") as fp:
+            yield loads(fp.read(), encoding, backend)
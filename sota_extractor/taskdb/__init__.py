@@ -1,4 +1,13 @@
-__all__ = ["Link", "SotaRow", "Sota", "Dataset", "Task", "TaskDB"]
+__all__ = [
+    "Link",
+    "SotaRow",
+    "Sota",
+    "Dataset",
+    "Task",
+    "TaskDB",
+    "SqliteTaskDB",
+]
 
 from sota_extractor.taskdb.v01.models import Link, SotaRow, Sota, Dataset, Task
 from sota_extractor.taskdb.v01.taskdb import TaskDB
+from sota_extractor.taskdb.v01.sqlite import SqliteTaskDB
@@ -0,0 +1,170 @@
+"""Compact variant of the TaskDB models.
+
+The classes have the same constructors and attributes as the models in
+`sota_extractor.taskdb.v01.models`, but use less memory:
+
+- the instances have `__slots__` instead of a `__dict__`,
+- metric names and link titles, repeated in every row, are interned.
+
+Values are interned only when the objects are created, not when the
+attributes are assigned later.
+"""
+
+import sys
+import reprlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+def new_list(value: Optional[List[Any]]) -> List[Any]:
+    """Use the list or a new empty list, like a `default_factory`."""
+    return [] if value is None else value
+
+
+def intern(value: Any) -> Any:
+    """Intern a string, other values are returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_keys(value: Dict[str, Any]) -> Dict[str, Any]:
+    return {intern(k): v for k, v in value.items()}
+
+
+class Model:
+    """Base of the compact models, compared and printed like dataclasses."""
+
+    __slots__ = ()
+
+    def astuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    @reprlib.recursive_repr()
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{self.__class__.__qualname__}({fields})"
+
+
+class Link(Model):
+    __slots__ = ("title", "url")
+
+    def __init__(self, title: str = "", url: str = ""):
+        self.title = intern(title)
+        self.url = url
+
+
+class SotaRow(Model):
+    __slots__ = (
+        "model_name",
+        "paper_title",
+        "paper_url",
+        "paper_date",
+        "code_links",
+        "model_links",
+        "metrics",
+        "uses_additional_data",
+    )
+
+    def __init__(
+        self,
+        model_name: str,
+        paper_title: str = "",
+        paper_url: str = "",
+        paper_date: Optional[datetime] = None,
+        code_links: List[Link] = None,
+        model_links: List[Link] = None,
+        metrics: Dict[str, str] = None,
+        uses_additional_data: bool = False,
+    ):
+        self.model_name = model_name
+        self.paper_title = paper_title
+        self.paper_url = paper_url
+        self.paper_date = paper_date
+        self.code_links = new_list(code_links)
+        self.model_links = new_list(model_links)
+        self.metrics = {} if metrics is None else intern_keys(metrics)
+        self.uses_additional_data = uses_additional_data
+
+
+class Sota(Model):
+    __slots__ = ("metrics", "rows")
+
+    def __init__(
+        self,
+        metrics: List[str] = None,
+        rows: List[SotaRow] = None,
+    ):
+        self.metrics = [] if metrics is None else [intern(m) for m in metrics]
+        self.rows = new_list(rows)
+
+
+class Dataset(Model):
+    __slots__ = (
+        "name",
+        "is_subdataset",
+        "description",
+        "parent",
+        "sota",
+        "subdatasets",
+        "links",
+        "citations",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        is_subdataset: bool = False,
+        description: str = "",
+        parent: "Dataset" = None,
+        sota: Sota = None,
+        subdatasets: List["Dataset"] = None,
+        links: List[Link] = None,
+        citations: List[Link] = None,
+    ):
+        self.name = name
+        self.is_subdataset = is_subdataset
+        self.description = description
+        self.parent = parent
+        self.sota = Sota() if sota is None else sota
+        self.subdatasets = new_list(subdatasets)
+        self.links = new_list(links)
+        self.citations = new_list(citations)
+
+
+class Task(Model):
+    __slots__ = (
+        "name",
+        "description",
+        "parent",
+        "categories",
+        "datasets",
+        "subtasks",
+        "synonyms",
+        "source_link",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        parent: "Task" = None,
+        categories: List[str] = None,
+        datasets: List[Dataset] = None,
+        subtasks: List["Task"] = None,
+        synonyms: List[str] = None,
+        source_link: Link = None,
+    ):
+        self.name = name
+        self.description = description
+        self.parent = parent
+        self.categories = new_list(categories)
+        self.datasets = new_list(datasets)
+        self.subtasks = new_list(subtasks)
+        self.synonyms = new_list(synonyms)
+        self.source_link = source_link
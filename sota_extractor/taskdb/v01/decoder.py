@@ -0,0 +1,535 @@
+"""Decoder of the deserialized task data into the TaskDB models.
+
+It's an equivalent of loading the data with the schemas from
+`sota_extractor.taskdb.v01.schemas` without the overhead of marshmallow: the
+data is validated the same way and invalid data raises a
+`marshmallow.ValidationError` with the same messages.
+"""
+
+import datetime
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple
+from typing import Optional
+
+from marshmallow import ValidationError
+
+from sota_extractor.taskdb.v01 import compact
+from sota_extractor.taskdb.v01.models import Link, SotaRow, Sota, Dataset, Task
+
+Errors = Dict[Any, Any]
+
+MISSING = object()
+
+REQUIRED = "Missing data for required field."
+NULL = "Field may not be null."
+INVALID_NESTED_TYPE = "Invalid type."
+INVALID_TYPE = "Invalid input type."
+UNKNOWN = "Unknown field."
+INVALID_STRING = "Not a valid string."
+INVALID_UTF8 = "Not a valid utf-8 string."
+INVALID_BOOLEAN = "Not a valid boolean."
+INVALID_DATE = "Not a valid date."
+INVALID_LIST = "Not a valid list."
+INVALID_MAPPING = "Not a valid mapping type."
+
+# Values accepted by `marshmallow.fields.Boolean`.
+TRUTHY = {
+    "t",
+    "T",
+    "true",
+    "True",
+    "TRUE",
+    "on",
+    "On",
+    "ON",
+    "y",
+    "Y",
+    "yes",
+    "Yes",
+    "YES",
+    "1",
+    1,
+    True,
+}
+FALSY = {
+    "f",
+    "F",
+    "false",
+    "False",
+    "FALSE",
+    "off",
+    "Off",
+    "OFF",
+    "n",
+    "N",
+    "no",
+    "No",
+    "NO",
+    "0",
+    0,
+    0.0,
+    False,
+}
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class Models(NamedTuple):
+    """Classes of the models built by the decoder."""
+
+    link: Callable[..., Any]
+    sota_row: Callable[..., Any]
+    sota: Callable[..., Any]
+    dataset: Callable[..., Any]
+    task: Callable[..., Any]
+
+
+MODELS = Models(Link, SotaRow, Sota, Dataset, Task)
+COMPACT_MODELS = Models(
+    compact.Link, compact.SotaRow, compact.Sota, compact.Dataset, compact.Task
+)
+
+LINK_FIELDS = {"title", "url"}
+SOTA_ROW_FIELDS = {
+    "model_name",
+    "paper_title",
+    "paper_url",
+    "paper_date",
+    "code_links",
+    "model_links",
+    "metrics",
+    "uses_additional_data",
+}
+SOTA_FIELDS = {"metrics", "rows"}
+DATASET_FIELDS = {
+    "name",
+    "is_subdataset",
+    "description",
+    "sota",
+    "subdatasets",
+    "dataset_links",
+    "dataset_citations",
+}
+TASK_FIELDS = {
+    "task",
+    "description",
+    "categories",
+    "datasets",
+    "subtasks",
+    "synonyms",
+    "source_link",
+}
+
+
+def is_mapping(value: Any) -> bool:
+    return isinstance(value, dict) or isinstance(value, Mapping)
+
+
+def is_collection(value: Any) -> bool:
+    return isinstance(value, (list, tuple))
+
+
+def check_unknown(data: Dict, fields: set, errors: Errors):
+    if not fields.issuperset(data):
+        for key in data:
+            if key not in fields:
+                errors[key] = [UNKNOWN]
+
+
+def text(value: Any) -> str:
+    """Validate a string, raises ValueError with the error message."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bytes):
+        try:
+            return value.decode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError(INVALID_UTF8)
+    raise ValueError(INVALID_STRING)
+
+
+def string(
+    data: Dict,
+    key: str,
+    errors: Errors,
+    default: Optional[str] = "",
+    required: bool = False,
+) -> Optional[str]:
+    value = data.get(key, MISSING)
+    if value is MISSING:
+        if required:
+            errors[key] = [REQUIRED]
+        return default
+    if isinstance(value, str):
+        return value
+    if value is None:
+        errors[key] = [NULL]
+        return None
+    try:
+        return text(value)
+    except ValueError as e:
+        errors[key] = [str(e)]
+        return None
+
+
+def boolean(data: Dict, key: str, errors: Errors, default: bool) -> bool:
+    value = data.get(key, MISSING)
+    if value is MISSING:
+        return default
+    if value is None:
+        errors[key] = [NULL]
+        return default
+    try:
+        if value in TRUTHY:
+            return True
+        if value in FALSY:
+            return False
+    except TypeError:
+        pass
+    errors[key] = [INVALID_BOOLEAN]
+    return default
+
+
+def date(data: Dict, key: str, errors: Errors) -> Optional[datetime.date]:
+    value = data.get(key)
+    if value is None:
+        return None
+    if not value:
+        errors[key] = [INVALID_DATE]
+        return None
+    if (
+        isinstance(value, str)
+        and len(value) == 10
+        and value[4] == value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        # Fast path for zero padded dates.
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return datetime.datetime.strptime(value, DATE_FORMAT).date()
+    except (TypeError, AttributeError, ValueError):
+        errors[key] = [INVALID_DATE]
+        return None
+
+
+def strings(data: Dict, key: str, errors: Errors) -> List[str]:
+    value = data.get(key, MISSING)
+    if value is MISSING:
+        return []
+    if value is None:
+        errors[key] = [NULL]
+        return []
+    if not is_collection(value):
+        errors[key] = [INVALID_LIST]
+        return []
+
+    result = []
+    item_errors = {}
+    for i, item in enumerate(value):
+        if isinstance(item, str):
+            result.append(item)
+        elif item is None:
+            item_errors[i] = [NULL]
+        else:
+            try:
+                result.append(text(item))
+            except ValueError as e:
+                item_errors[i] = [str(e)]
+    if item_errors:
+        errors[key] = item_errors
+    return result
+
+
+def mapping(data: Dict, key: str, errors: Errors) -> Any:
+    value = data.get(key, MISSING)
+    if value is MISSING:
+        return MISSING
+    if value is None:
+        errors[key] = [NULL]
+        return MISSING
+    if not is_mapping(value):
+        errors[key] = [INVALID_MAPPING]
+        return MISSING
+
+    result = {}
+    key_errors = {}
+    for k, v in value.items():
+        # Errors are reported under the original key.
+        item_errors = {}
+        name = k
+        if not isinstance(k, str):
+            try:
+                name = text(k)
+            except ValueError as e:
+                item_errors["key"] = [str(e)]
+        if v is None:
+            item_errors["value"] = [NULL]
+        if item_errors:
+            key_errors[k] = item_errors
+        else:
+            result[name] = v
+    if key_errors:
+        errors[key] = key_errors
+    return result
+
+
+def nested(
+    data: Dict,
+    key: str,
+    errors: Errors,
+    decode: Callable[[Dict, Errors, Models], Any],
+    default: Callable[[], Any],
+    models: Models,
+    allow_none: bool = False,
+) -> Any:
+    value = data.get(key, MISSING)
+    if value is MISSING:
+        return default()
+    if value is None:
+        if not allow_none:
+            errors[key] = [NULL]
+        return None
+    if not is_mapping(value):
+        errors[key] = {"_schema": [INVALID_TYPE]}
+        return None
+
+    nested_errors = {}
+    result = decode(value, nested_errors, models)
+    if nested_errors:
+        errors[key] = nested_errors
+    return result
+
+
+def nested_many(
+    data: Dict,
+    key: str,
+    errors: Errors,
+    decode: Callable[[Dict, Errors, Models], Any],
+    models: Models,
+) -> List[Any]:
+    value = data.get(key, MISSING)
+    if value is MISSING:
+        return []
+    if value is None:
+        errors[key] = [NULL]
+        return []
+    if not is_collection(value):
+        errors[key] = [INVALID_NESTED_TYPE]
+        return []
+
+    many_errors = {}
+    result = decode_many(value, decode, many_errors, models)
+    if many_errors:
+        errors[key] = many_errors
+    return result
+
+
+def decode_many(
+    data: Any,
+    decode: Callable[[Dict, Errors, Models], Any],
+    errors: Errors,
+    models: Models,
+) -> List[Any]:
+    if not is_collection(data):
+        errors["_schema"] = [INVALID_TYPE]
+        return []
+
+    result = []
+    for i, item in enumerate(data):
+        if not is_mapping(item):
+            errors[i] = {"_schema": [INVALID_TYPE]}
+            continue
+        item_errors = {}
+        result.append(decode(item, item_errors, models))
+        if item_errors:
+            errors[i] = item_errors
+    return result
+
+
+def decode_link(data: Dict, errors: Errors, models: Models) -> Link:
+    check_unknown(data, LINK_FIELDS, errors)
+    return models.link(
+        title=string(data, "title", errors), url=string(data, "url", errors)
+    )
+
+
+def decode_sota_row(data: Dict, errors: Errors, models: Models) -> SotaRow:
+    check_unknown(data, SOTA_ROW_FIELDS, errors)
+    metrics = mapping(data, "metrics", errors)
+    return models.sota_row(
+        model_name=string(data, "model_name", errors, None, required=True),
+        paper_title=string(data, "paper_title", errors),
+        paper_url=string(data, "paper_url", errors),
+        paper_date=date(data, "paper_date", errors),
+        code_links=nested_many(
+            data, "code_links", errors, decode_link, models
+        ),
+        model_links=nested_many(
+            data, "model_links", errors, decode_link, models
+        ),
+        metrics={} if metrics is MISSING else metrics,
+        uses_additional_data=boolean(
+            data, "uses_additional_data", errors, False
+        ),
+    )
+
+
+def decode_sota(data: Dict, errors: Errors, models: Models) -> Sota:
+    check_unknown(data, SOTA_FIELDS, errors)
+    return models.sota(
+        metrics=strings(data, "metrics", errors),
+        rows=nested_many(data, "rows", errors, decode_sota_row, models),
+    )
+
+
+def decode_dataset(data: Dict, errors: Errors, models: Models) -> Dataset:
+    # Equivalent of `DatasetSchema.pre_load`
+    if "dataset" in data:
+        name_key = "dataset"
+        is_subdataset = False
+    elif "subdataset" in data:
+        name_key = "subdataset"
+        is_subdataset = True
+    else:
+        name_key = None
+        is_subdataset = False
+
+    unknown = {}
+    check_unknown(data, DATASET_FIELDS, unknown)
+    unknown.pop(name_key, None)
+    errors.update(unknown)
+
+    if name_key is None:
+        name = ""
+    else:
+        name = data[name_key]
+        if name is None:
+            errors["name"] = [NULL]
+        elif not isinstance(name, str):
+            try:
+                name = text(name)
+            except ValueError as e:
+                errors["name"] = [str(e)]
+
+    dataset = models.dataset(
+        name=name,
+        is_subdataset=is_subdataset,
+        description=string(data, "description", errors),
+        sota=nested(data, "sota", errors, decode_sota, models.sota, models),
+        subdatasets=nested_many(
+            data, "subdatasets", errors, decode_dataset, models
+        ),
+        links=nested_many(data, "dataset_links", errors, decode_link, models),
+        citations=nested_many(
+            data, "dataset_citations", errors, decode_link, models
+        ),
+    )
+    for subdataset in dataset.subdatasets:
+        subdataset.parent = dataset
+    return dataset
+
+
+def decode_task(data: Dict, errors: Errors, models: Models) -> Task:
+    check_unknown(data, TASK_FIELDS, errors)
+    task = models.task(
+        name=string(data, "task", errors, None, required=True),
+        description=string(data, "description", errors),
+        categories=strings(data, "categories", errors),
+        datasets=nested_many(data, "datasets", errors, decode_dataset, models),
+        subtasks=nested_many(data, "subtasks", errors, decode_task, models),
+        synonyms=strings(data, "synonyms", errors),
+        source_link=nested(
+            data,
+            "source_link",
+            errors,
+            decode_link,
+            lambda: None,
+            models,
+            allow_none=True,
+        ),
+    )
+    for subtask in task.subtasks:
+        subtask.parent = task
+    return task
+
+
+def iter_tasks(data: Iterable[Dict], compact: bool = False) -> Iterator[Task]:
+    """Build tasks one by one from dictionaries representing them.
+
+    Args:
+        data (Iterable[Dict]): Deserialized task data.
+        compact (bool): Build the models from
+            `sota_extractor.taskdb.v01.compact`.
+
+    Returns:
+        Iterator[Task]: Tasks, invalid tasks are skipped.
+
+    Raises:
+        marshmallow.ValidationError: After the last task if any of the tasks
+            is not valid.
+    """
+    models = COMPACT_MODELS if compact else MODELS
+    errors = {}
+    for i, item in enumerate(data):
+        if not is_mapping(item):
+            errors[i] = {"_schema": [INVALID_TYPE]}
+            continue
+        item_errors = {}
+        task = decode_task(item, item_errors, models)
+        if item_errors:
+            errors[i] = item_errors
+        else:
+            yield task
+    if errors:
+        raise ValidationError(errors)
+
+
+def load_task(data: Dict, compact: bool = False) -> Task:
+    """Build a task from a dictionary representing it.
+
+    Args:
+        data (Dict): Deserialized task data.
+        compact (bool): Build the models from
+            `sota_extractor.taskdb.v01.compact`.
+
+    Returns:
+        Task: The task.
+
+    Raises:
+        marshmallow.ValidationError: If the data is not valid.
+    """
+    if not is_mapping(data):
+        raise ValidationError({"_schema": [INVALID_TYPE]})
+    errors = {}
+    task = decode_task(data, errors, COMPACT_MODELS if compact else MODELS)
+    if errors:
+        raise ValidationError(errors)
+    return task
+
+
+def load_tasks(data: List[Dict], compact: bool = False) -> List[Task]:
+    """Build tasks from a list of dictionaries representing them.
+
+    Args:
+        data (List[Dict]): Deserialized task data.
+        compact (bool): Build the models from
+            `sota_extractor.taskdb.v01.compact`.
+
+    Returns:
+        List[Task]: Tasks.
+
+    Raises:
+        marshmallow.ValidationError: If the data is not valid.
+    """
+    errors = {}
+    tasks = decode_many(
+        data, decode_task, errors, COMPACT_MODELS if compact else MODELS
+    )
+    if errors:
+        raise ValidationError(errors)
+    return tasks
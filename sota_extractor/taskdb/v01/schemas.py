@@ -1,4 +1,4 @@
-from copy import deepcopy
+from collections.abc import Mapping
 from marshmallow import Schema, fields, pre_load, post_load, post_dump
 from sota_extractor.taskdb.v01.models import Link, SotaRow, Sota, Dataset, Task
 
@@ -53,15 +53,18 @@ class DatasetSchema(Schema):
 
     @pre_load
     def pre_load(self, data, **kwargs):
-        data = deepcopy(data)
+        if not isinstance(data, Mapping):
+            # Left for the validation to reject.
+            return data
+        # Only the keys are renamed, so a shallow copy is enough and the
+        # input is left untouched without copying the rows.
+        data = dict(data)
         if "dataset" in data:
-            data["name"] = data["dataset"]
+            data["name"] = data.pop("dataset")
             data["is_subdataset"] = False
-            del data["dataset"]
         elif "subdataset" in data:
-            data["name"] = data["subdataset"]
+            data["name"] = data.pop("subdataset")
             data["is_subdataset"] = True
-            del data["subdataset"]
         else:
             data["name"] = ""
             data["is_subdataset"] = False
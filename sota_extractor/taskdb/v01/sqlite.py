@@ -0,0 +1,689 @@
+import io
+import csv
+import json
+import sqlite3
+import datetime
+import functools
+import itertools
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sota_extractor.consts import Format
+from sota_extractor.errors import ArgumentError
+from sota_extractor.taskdb.v01 import decoder
+from sota_extractor.taskdb.v01.models import Link, SotaRow, Dataset, Task
+from sota_extractor.taskdb.v01.schemas import TaskSchema
+
+SCHEMA_VERSION = 1
+
+# Every row references the top-level task it belongs to, so a whole top-level
+# task is read, replaced or deleted with a single indexed query per table.
+# The values of the models are nullable, like the model attributes, only the
+# task names and synonyms which are indexed by TaskDB too are required.
+SCHEMA = """
+CREATE TABLE tasks (
+    id INTEGER PRIMARY KEY,
+    root_id INTEGER NOT NULL,
+    parent_id INTEGER,
+    position INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    folded_name TEXT NOT NULL,
+    description TEXT
+);
+CREATE INDEX tasks_root_id ON tasks (root_id);
+CREATE INDEX tasks_name ON tasks (name);
+CREATE INDEX tasks_folded_name ON tasks (folded_name);
+
+CREATE TABLE task_categories (
+    root_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    category TEXT
+);
+CREATE INDEX task_categories_root_id ON task_categories (root_id);
+
+CREATE TABLE task_synonyms (
+    root_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    synonym TEXT NOT NULL,
+    folded_synonym TEXT NOT NULL
+);
+CREATE INDEX task_synonyms_root_id ON task_synonyms (root_id);
+CREATE INDEX task_synonyms_synonym ON task_synonyms (synonym);
+CREATE INDEX task_synonyms_folded_synonym ON task_synonyms (folded_synonym);
+
+CREATE TABLE datasets (
+    id INTEGER PRIMARY KEY,
+    root_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    parent_id INTEGER,
+    position INTEGER NOT NULL,
+    name TEXT,
+    is_subdataset INTEGER,
+    description TEXT
+);
+CREATE INDEX datasets_root_id ON datasets (root_id);
+CREATE INDEX datasets_task_id ON datasets (task_id);
+CREATE INDEX datasets_parent_id ON datasets (parent_id);
+CREATE INDEX datasets_name ON datasets (name);
+
+CREATE TABLE sota_metrics (
+    root_id INTEGER NOT NULL,
+    dataset_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    metric TEXT
+);
+CREATE INDEX sota_metrics_root_id ON sota_metrics (root_id);
+CREATE INDEX sota_metrics_metric ON sota_metrics (metric);
+
+CREATE TABLE sota_rows (
+    id INTEGER PRIMARY KEY,
+    root_id INTEGER NOT NULL,
+    dataset_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    model_name TEXT,
+    paper_title TEXT,
+    paper_url TEXT,
+    paper_date TEXT,
+    uses_additional_data INTEGER
+);
+CREATE INDEX sota_rows_root_id ON sota_rows (root_id);
+CREATE INDEX sota_rows_dataset_id ON sota_rows (dataset_id);
+CREATE INDEX sota_rows_paper_url ON sota_rows (paper_url);
+
+CREATE TABLE row_metrics (
+    root_id INTEGER NOT NULL,
+    row_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    metric TEXT,
+    value TEXT NOT NULL
+);
+CREATE INDEX row_metrics_root_id ON row_metrics (root_id);
+CREATE INDEX row_metrics_metric ON row_metrics (metric);
+
+CREATE TABLE links (
+    root_id INTEGER NOT NULL,
+    owner_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    url TEXT
+);
+CREATE INDEX links_root_id ON links (root_id);
+"""
+
+TABLES = [
+    "tasks",
+    "task_categories",
+    "task_synonyms",
+    "datasets",
+    "sota_metrics",
+    "sota_rows",
+    "row_metrics",
+    "links",
+]
+
+# Kinds of links, the owner is a task, a dataset or a sota row.
+SOURCE_LINK = "source_link"
+DATASET_LINK = "dataset_link"
+DATASET_CITATION = "dataset_citation"
+CODE_LINK = "code_link"
+MODEL_LINK = "model_link"
+
+
+def date_string(value: Optional[datetime.date]) -> Optional[str]:
+    """Format a date or the date of a datetime like `fields.Date` dumps it."""
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return value.isoformat()
+
+
+def nullable_bool(value: Optional[int]) -> Optional[bool]:
+    return None if value is None else bool(value)
+
+
+def locked(method):
+    """Run the method holding the lock of the database connection."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class SqliteTaskDB:
+    """TaskDB stored in a SQLite database.
+
+    Tasks are stored in normalized tables and only the top-level tasks needed
+    to answer a query are read from the database. Tasks returned by the
+    queries are new instances, modifying them doesn't change the database.
+
+    The instance can be shared by threads, the methods use the connection one
+    at a time.
+
+    Args:
+        filename (str): Path to the database file, created if missing. By
+            default the database is kept in memory.
+    """
+
+    def __init__(self, filename: str = ":memory:"):
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.schema = TaskSchema()
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            with self.connection:
+                self.connection.executescript(SCHEMA)
+                self.connection.execute(
+                    f"PRAGMA user_version = {SCHEMA_VERSION}"
+                )
+        elif version != SCHEMA_VERSION:
+            raise ArgumentError(
+                f"Unsupported SqliteTaskDB schema version: {version}"
+            )
+
+    @locked
+    def close(self):
+        self.connection.close()
+
+    @locked
+    def get_task(
+        self, name: str, synonyms: bool = False, casefold: bool = False
+    ) -> Optional[Task]:
+        """Get a task or a sub-task at any depth by name.
+
+        If multiple tasks share the name, the one closest to the top level is
+        returned.
+
+        Args:
+            name (str): Name of the task.
+            synonyms (bool): Also look up the task by its synonyms.
+            casefold (bool): If there is no exact match, look up the task
+                ignoring the case.
+
+        Returns:
+            Task: The task or None if it doesn't exist.
+        """
+        row = self._find(name, synonyms=synonyms, casefold=casefold)
+        if row is None:
+            return None
+        task_id, root_id = row
+        tasks, _ = self._read_task(root_id)
+        return tasks[task_id]
+
+    def _find(
+        self, name: str, synonyms: bool = False, casefold: bool = False
+    ) -> Optional[Tuple[int, int]]:
+        """Find the ids of a task and of its top-level task by name."""
+        queries = [("tasks.name = ?", name)]
+        if synonyms:
+            queries.append(
+                (
+                    "tasks.id IN "
+                    "(SELECT task_id FROM task_synonyms WHERE synonym = ?)",
+                    name,
+                )
+            )
+        if casefold:
+            folded = name.casefold()
+            queries.append(("tasks.folded_name = ?", folded))
+            if synonyms:
+                queries.append(
+                    (
+                        "tasks.id IN (SELECT task_id FROM task_synonyms "
+                        "WHERE folded_synonym = ?)",
+                        folded,
+                    )
+                )
+
+        for condition, value in queries:
+            row = self.connection.execute(
+                f"""
+                SELECT tasks.id, tasks.root_id FROM tasks
+                JOIN tasks AS roots ON roots.id = tasks.root_id
+                WHERE {condition}
+                ORDER BY tasks.depth, roots.position, tasks.id
+                LIMIT 1
+                """,
+                (value,),
+            ).fetchone()
+            if row is not None:
+                return row
+        return None
+
+    @locked
+    def add_task(self, task: Task):
+        """Add a top-level task by name, replacing the existing one."""
+        with self.connection:
+            self._add_task(task)
+
+    @locked
+    def load_tasks(
+        self,
+        files: List[str] = None,
+        data: List[Dict] = None,
+        fmt: Format = None,
+    ):
+        """Load tasks from files or from data in a single transaction.
+
+        Args:
+            files (List[str] | str): Path to a document or a list of paths to
+                documents.
+            data: Sota data - list of dictionaries representing tasks.
+            fmt (Format): Serialization format of the files, inferred from
+                their extensions if not set.
+        """
+        from sota_extractor.serialization import infer_format, iter_load
+
+        if files is None and data is None:
+            raise ArgumentError("Either 'files' or 'data' must be supplied.")
+
+        if isinstance(files, str):
+            files = [files]
+
+        if files is not None:
+            data = itertools.chain.from_iterable(
+                iter_load(file, fmt=fmt or infer_format(file))
+                for file in files
+            )
+            tasks = decoder.iter_tasks(data)
+        else:
+            tasks = decoder.load_tasks(data)
+
+        with self.connection:
+            for task in tasks:
+                self._add_task(task)
+
+    @locked
+    def load_synonyms(self, csv_files: List[str], casefold: bool = False):
+        """Load task synonyms from input files in a single transaction.
+
+        Args:
+            csv_files (List[str] | str): Path to a CSV file or a list of paths
+                to CSV files with a task name and its synonym on every row.
+            casefold (bool): Match the task names ignoring the case.
+        """
+        if isinstance(csv_files, str):
+            csv_files = [csv_files]
+        with self.connection:
+            for csv_file in csv_files:
+                with io.open(csv_file, newline="") as f:
+                    reader = csv.reader(f)
+                    for row in reader:
+                        found = self._find(row[0], casefold=casefold)
+                        if found is not None:
+                            task_id, root_id = found
+                            self._add_synonym(root_id, task_id, row[1])
+
+    def _add_synonym(self, root_id: int, task_id: int, synonym: str):
+        """Append a synonym to the synonyms of a task."""
+        self.connection.execute(
+            "INSERT INTO task_synonyms "
+            "SELECT ?, ?, COALESCE(MAX(position) + 1, 0), ?, ? "
+            "FROM task_synonyms WHERE root_id = ? AND task_id = ?",
+            (root_id, task_id, synonym, synonym.casefold(), root_id, task_id),
+        )
+
+    @locked
+    def tasks_with_sota(self) -> List[Task]:
+        """Extract all tasks with SOTA tables.
+
+        This includes both the top-level and sub-tasks.
+        """
+        rows = self.connection.execute("""
+            SELECT tasks.id, tasks.root_id FROM tasks
+            JOIN tasks AS roots ON roots.id = tasks.root_id
+            WHERE tasks.id IN (
+                SELECT datasets.task_id FROM datasets
+                JOIN sota_rows ON sota_rows.dataset_id = datasets.id
+                WHERE datasets.parent_id IS NULL
+                UNION
+                SELECT datasets.task_id FROM datasets
+                JOIN datasets AS subdatasets
+                    ON subdatasets.parent_id = datasets.id
+                JOIN sota_rows ON sota_rows.dataset_id = subdatasets.id
+                WHERE datasets.parent_id IS NULL
+            )
+            ORDER BY roots.position, tasks.id
+            """).fetchall()
+
+        sota_tasks = []
+        for root_id, group in itertools.groupby(rows, key=lambda r: r[1]):
+            tasks, _ = self._read_task(root_id)
+            sota_tasks.extend(tasks[task_id] for task_id, _ in group)
+        return sota_tasks
+
+    @locked
+    def datasets_with_sota(self) -> List[Dataset]:
+        """Extract all datasets with SOTA tables.
+
+        This includes both the top-level and sub-tasks.
+        """
+        rows = self.connection.execute("""
+            SELECT datasets.id, datasets.task_id, datasets.root_id,
+                EXISTS (
+                    SELECT 1 FROM sota_rows
+                    WHERE sota_rows.dataset_id = datasets.id
+                ) OR EXISTS (
+                    SELECT 1 FROM datasets AS subdatasets
+                    JOIN sota_rows ON sota_rows.dataset_id = subdatasets.id
+                    WHERE subdatasets.parent_id = datasets.id
+                )
+            FROM datasets
+            JOIN tasks AS roots ON roots.id = datasets.root_id
+            WHERE datasets.parent_id IS NULL
+            ORDER BY roots.position, datasets.task_id, datasets.position
+            """).fetchall()
+
+        # Same as `find_sota_datasets`, once a dataset of a task has a SOTA
+        # table all the following datasets of the task are included.
+        selected = []
+        for _, group in itertools.groupby(rows, key=lambda r: r[1]):
+            add = False
+            for dataset_id, _, root_id, has_sota in group:
+                add = add or bool(has_sota)
+                if add:
+                    selected.append((dataset_id, root_id))
+
+        sota_datasets = []
+        for root_id, group in itertools.groupby(selected, key=lambda r: r[1]):
+            _, datasets = self._read_task(root_id)
+            sota_datasets.extend(
+                datasets[dataset_id] for dataset_id, _ in group
+            )
+        return sota_datasets
+
+    @locked
+    def export(self) -> List[Dict[str, Any]]:
+        """Export the whole of TaskDB into a list of tasks in Dict format."""
+        return [self.schema.dump(task) for task in self._iter_tasks()]
+
+    def _iter_tasks(self) -> Iterator[Task]:
+        """Read the top-level tasks one by one."""
+        root_ids = self.connection.execute(
+            "SELECT id FROM tasks WHERE parent_id IS NULL ORDER BY position"
+        ).fetchall()
+        for (root_id,) in root_ids:
+            tasks, _ = self._read_task(root_id)
+            yield tasks[root_id]
+
+    def _add_task(self, task: Task):
+        row = self.connection.execute(
+            "SELECT id, position FROM tasks "
+            "WHERE parent_id IS NULL AND name = ?",
+            (task.name,),
+        ).fetchone()
+        if row is not None:
+            # Replace the existing task keeping its position.
+            root_id, position = row
+            for table in TABLES:
+                self.connection.execute(
+                    f"DELETE FROM {table} WHERE root_id = ?", (root_id,)
+                )
+        else:
+            position = self.connection.execute(
+                "SELECT COALESCE(MAX(position) + 1, 0) FROM tasks "
+                "WHERE parent_id IS NULL"
+            ).fetchone()[0]
+        Writer(self.connection).write_task(task, position)
+
+    def _read_task(
+        self, root_id: int
+    ) -> Tuple[Dict[int, Task], Dict[int, Dataset]]:
+        """Read a top-level task.
+
+        Returns:
+            Tuple[Dict[int, Task], Dict[int, Dataset]]: The task and its
+                subtasks and the datasets of all of them by id.
+        """
+        return Reader(self.connection, root_id).read()
+
+
+class Writer:
+    """Insert a top-level task into the database."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.root_id = None
+
+    def write_task(
+        self,
+        task: Task,
+        position: int,
+        parent_id: Optional[int] = None,
+        depth: int = 0,
+    ):
+        cursor = self.connection.execute(
+            "INSERT INTO tasks (root_id, parent_id, position, depth, name, "
+            "folded_name, description) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.root_id or 0,
+                parent_id,
+                position,
+                depth,
+                task.name,
+                task.name.casefold(),
+                task.description,
+            ),
+        )
+        task_id = cursor.lastrowid
+        if self.root_id is None:
+            self.root_id = task_id
+            self.connection.execute(
+                "UPDATE tasks SET root_id = ? WHERE id = ?",
+                (task_id, task_id),
+            )
+
+        self.connection.executemany(
+            "INSERT INTO task_categories VALUES (?, ?, ?, ?)",
+            [
+                (self.root_id, task_id, i, category)
+                for i, category in enumerate(task.categories)
+            ],
+        )
+        self.connection.executemany(
+            "INSERT INTO task_synonyms VALUES (?, ?, ?, ?, ?)",
+            [
+                (self.root_id, task_id, i, synonym, synonym.casefold())
+                for i, synonym in enumerate(task.synonyms)
+            ],
+        )
+        if task.source_link is not None:
+            self.write_links(task_id, SOURCE_LINK, [task.source_link])
+        for i, dataset in enumerate(task.datasets):
+            self.write_dataset(dataset, task_id, i)
+        for i, subtask in enumerate(task.subtasks):
+            self.write_task(subtask, i, parent_id=task_id, depth=depth + 1)
+
+    def write_dataset(
+        self,
+        dataset: Dataset,
+        task_id: int,
+        position: int,
+        parent_id: Optional[int] = None,
+    ):
+        cursor = self.connection.execute(
+            "INSERT INTO datasets (root_id, task_id, parent_id, position, "
+            "name, is_subdataset, description) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.root_id,
+                task_id,
+                parent_id,
+                position,
+                dataset.name,
+                dataset.is_subdataset,
+                dataset.description,
+            ),
+        )
+        dataset_id = cursor.lastrowid
+        self.write_links(dataset_id, DATASET_LINK, dataset.links)
+        self.write_links(dataset_id, DATASET_CITATION, dataset.citations)
+        self.connection.executemany(
+            "INSERT INTO sota_metrics VALUES (?, ?, ?, ?)",
+            [
+                (self.root_id, dataset_id, i, metric)
+                for i, metric in enumerate(dataset.sota.metrics)
+            ],
+        )
+        for i, row in enumerate(dataset.sota.rows):
+            self.write_row(row, dataset_id, i)
+        for i, subdataset in enumerate(dataset.subdatasets):
+            self.write_dataset(subdataset, task_id, i, parent_id=dataset_id)
+
+    def write_row(self, row: SotaRow, dataset_id: int, position: int):
+        cursor = self.connection.execute(
+            "INSERT INTO sota_rows (root_id, dataset_id, position, "
+            "model_name, paper_title, paper_url, paper_date, "
+            "uses_additional_data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.root_id,
+                dataset_id,
+                position,
+                row.model_name,
+                row.paper_title,
+                row.paper_url,
+                date_string(row.paper_date),
+                row.uses_additional_data,
+            ),
+        )
+        row_id = cursor.lastrowid
+        self.write_links(row_id, CODE_LINK, row.code_links)
+        self.write_links(row_id, MODEL_LINK, row.model_links)
+        self.connection.executemany(
+            "INSERT INTO row_metrics VALUES (?, ?, ?, ?, ?)",
+            [
+                (self.root_id, row_id, i, metric, json.dumps(value))
+                for i, (metric, value) in enumerate(row.metrics.items())
+            ],
+        )
+
+    def write_links(self, owner_id: int, kind: str, links: List[Link]):
+        self.connection.executemany(
+            "INSERT INTO links VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (self.root_id, owner_id, kind, i, link.title, link.url)
+                for i, link in enumerate(links)
+            ],
+        )
+
+
+class Reader:
+    """Read a top-level task from the database."""
+
+    def __init__(self, connection: sqlite3.Connection, root_id: int):
+        self.connection = connection
+        self.root_id = root_id
+
+    def select(self, query: str) -> List[Tuple]:
+        return self.connection.execute(query, (self.root_id,)).fetchall()
+
+    def read(self) -> Tuple[Dict[int, Task], Dict[int, Dataset]]:
+        tasks = {}
+        # Parents are always inserted before their children.
+        for task_id, parent_id, name, description in self.select(
+            "SELECT id, parent_id, name, description FROM tasks "
+            "WHERE root_id = ? ORDER BY id"
+        ):
+            task = Task(name=name, description=description)
+            tasks[task_id] = task
+            if parent_id is not None:
+                task.parent = tasks[parent_id]
+                task.parent.subtasks.append(task)
+
+        for task_id, category in self.select(
+            "SELECT task_id, category FROM task_categories "
+            "WHERE root_id = ? ORDER BY task_id, position"
+        ):
+            tasks[task_id].categories.append(category)
+        for task_id, synonym in self.select(
+            "SELECT task_id, synonym FROM task_synonyms "
+            "WHERE root_id = ? ORDER BY task_id, position"
+        ):
+            tasks[task_id].synonyms.append(synonym)
+
+        datasets = {}
+        for (
+            dataset_id,
+            task_id,
+            parent_id,
+            name,
+            is_subdataset,
+            description,
+        ) in self.select(
+            "SELECT id, task_id, parent_id, name, is_subdataset, description "
+            "FROM datasets WHERE root_id = ? ORDER BY id"
+        ):
+            dataset = Dataset(
+                name=name,
+                is_subdataset=nullable_bool(is_subdataset),
+                description=description,
+            )
+            datasets[dataset_id] = dataset
+            if parent_id is None:
+                tasks[task_id].datasets.append(dataset)
+            else:
+                dataset.parent = datasets[parent_id]
+                dataset.parent.subdatasets.append(dataset)
+
+        for dataset_id, metric in self.select(
+            "SELECT dataset_id, metric FROM sota_metrics "
+            "WHERE root_id = ? ORDER BY dataset_id, position"
+        ):
+            datasets[dataset_id].sota.metrics.append(metric)
+
+        rows = {}
+        for (
+            row_id,
+            dataset_id,
+            model_name,
+            paper_title,
+            paper_url,
+            paper_date,
+            uses_additional_data,
+        ) in self.select(
+            "SELECT id, dataset_id, model_name, paper_title, paper_url, "
+            "paper_date, uses_additional_data FROM sota_rows "
+            "WHERE root_id = ? ORDER BY id"
+        ):
+            row = SotaRow(
+                model_name=model_name,
+                paper_title=paper_title,
+                paper_url=paper_url,
+                paper_date=(
+                    None
+                    if paper_date is None
+                    else datetime.date.fromisoformat(paper_date)
+                ),
+                uses_additional_data=nullable_bool(uses_additional_data),
+            )
+            rows[row_id] = row
+            datasets[dataset_id].sota.rows.append(row)
+
+        for row_id, metric, value in self.select(
+            "SELECT row_id, metric, value FROM row_metrics "
+            "WHERE root_id = ? ORDER BY row_id, position"
+        ):
+            rows[row_id].metrics[metric] = json.loads(value)
+
+        for owner_id, kind, title, url in self.select(
+            "SELECT owner_id, kind, title, url FROM links "
+            "WHERE root_id = ? ORDER BY kind, owner_id, position"
+        ):
+            link = Link(title=title, url=url)
+            if kind == SOURCE_LINK:
+                tasks[owner_id].source_link = link
+            elif kind == DATASET_LINK:
+                datasets[owner_id].links.append(link)
+            elif kind == DATASET_CITATION:
+                datasets[owner_id].citations.append(link)
+            elif kind == CODE_LINK:
+                rows[owner_id].code_links.append(link)
+            elif kind == MODEL_LINK:
+                rows[owner_id].model_links.append(link)
+        return tasks, datasets
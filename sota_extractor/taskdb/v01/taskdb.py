@@ -1,69 +1,382 @@
 import io
 import csv
-from typing import Dict, List, Optional, Any
+import itertools
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Any
+from typing import Tuple, Union
+
+from marshmallow import ValidationError
 
 from sota_extractor.consts import Format
 from sota_extractor.errors import ArgumentError
+from sota_extractor.taskdb.v01 import decoder
 from sota_extractor.taskdb.v01.models import Task, Dataset
 from sota_extractor.taskdb.v01.schemas import TaskSchema
 
 
+class TaskPath(NamedTuple):
+    """Location of a task that wasn't built yet.
+
+    The name of the top-level task and the positions of the subtasks leading
+    from it to the task.
+    """
+
+    root: str
+    subtasks: Tuple[int, ...] = ()
+
+
+class TaskData(NamedTuple):
+    """Data of a task loaded lazily."""
+
+    data: Dict
+    compact: bool = False
+
+
+class TaskMapping(MutableMapping):
+    """Top-level tasks by name.
+
+    Besides tasks the mapping holds the data of tasks loaded lazily, the task
+    is built from the data the first time it's accessed.
+
+    Args:
+        on_build (Callable[[str, Task], None]): Called with the name and the
+            task when a lazily loaded task is built.
+    """
+
+    def __init__(self, on_build: Callable[[str, Task], None] = None):
+        self.entries: Dict[str, Union[Task, TaskData]] = {}
+        self.on_build = on_build
+
+    def __getitem__(self, name: str) -> Task:
+        entry = self.entries[name]
+        if isinstance(entry, TaskData):
+            entry = decoder.load_task(entry.data, compact=entry.compact)
+            self.entries[name] = entry
+            if self.on_build is not None:
+                self.on_build(name, entry)
+        return entry
+
+    def __setitem__(self, name: str, task: Task):
+        self.entries[name] = task
+
+    def __delitem__(self, name: str):
+        del self.entries[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def is_loaded(self, name: str) -> bool:
+        """Check if the task was already built."""
+        return not isinstance(self.entries[name], TaskData)
+
+
+class IndexEntry(NamedTuple):
+    """Task indexed under a key, at a depth under a top-level task."""
+
+    depth: int
+    task: Union[Task, TaskPath]
+    root: str
+
+
+class TaskIndex:
+    """Index of tasks at all depths by a key.
+
+    Every task found under a key is kept, so replacing a top-level task only
+    removes the entries of its subtree. If multiple tasks share a key, the
+    index returns the one closest to the top level and of those the one added
+    first.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, List[IndexEntry]] = {}
+        # Keys of the entries by the name of their top-level task.
+        self.roots: Dict[str, List[str]] = {}
+
+    def add(
+        self, key: str, depth: int, task: Union[Task, TaskPath], root: str
+    ):
+        """Add a task found at the given depth of a top-level task."""
+        self.entries.setdefault(key, []).append(IndexEntry(depth, task, root))
+        self.roots.setdefault(root, []).append(key)
+
+    def remove(self, root: str):
+        """Remove the entries of a top-level task and of its subtasks."""
+        for key in self.roots.pop(root, []):
+            entries = self.entries.get(key)
+            if entries is None:
+                continue
+            entries = [entry for entry in entries if entry.root != root]
+            if entries:
+                self.entries[key] = entries
+            else:
+                del self.entries[key]
+
+    def resolve(self, name: str, root: Task):
+        """Replace the paths into a top-level task that was just built.
+
+        Paths are resolved right away, before the subtasks can change.
+        """
+        for key in self.roots.get(name, []):
+            entries = self.entries[key]
+            for i, entry in enumerate(entries):
+                if entry.root == name and isinstance(entry.task, TaskPath):
+                    task = root
+                    for j in entry.task.subtasks:
+                        task = task.subtasks[j]
+                    entries[i] = entry._replace(task=task)
+
+    def get(self, key: str) -> Optional[IndexEntry]:
+        """Get the entry closest to the top level indexed under the key."""
+        entries = self.entries.get(key)
+        if entries is None:
+            return None
+        return min(entries, key=lambda entry: entry.depth)
+
+
 class TaskDB:
     def __init__(self):
-        self.tasks: Dict[str, Task] = {}
+        self.tasks = TaskMapping(on_build=self._resolve)
         self.schema = TaskSchema()
-
-    def get_task(self, name: str) -> Optional[Task]:
-        """Get a task or a sub-task by name."""
-        if name in self.tasks:
-            return self.tasks[name]
-        else:
-            for task in self.tasks.values():
-                for subtask in task.subtasks:
-                    if subtask.name == name:
-                        return subtask
+        self._names = TaskIndex()
+        self._synonyms = TaskIndex()
+        self._folded_names = TaskIndex()
+        self._folded_synonyms = TaskIndex()
+
+    @property
+    def _indexes(self) -> List[TaskIndex]:
+        return [
+            self._names,
+            self._synonyms,
+            self._folded_names,
+            self._folded_synonyms,
+        ]
+
+    def _unindex(self, name: str):
+        """Remove a top-level task and its subtasks from the indexes."""
+        for index in self._indexes:
+            index.remove(name)
+
+    def _resolve(self, name: str, task: Task):
+        """Index a lazily loaded task by itself once it's built."""
+        for index in self._indexes:
+            index.resolve(name, task)
+
+    def _index_task(self, task: Task, depth: int, root: str):
+        """Index the task and its subtasks."""
+        self._names.add(task.name, depth, task, root)
+        self._folded_names.add(task.name.casefold(), depth, task, root)
+        for synonym in task.synonyms:
+            self._index_synonym(synonym, depth, task, root)
+        for subtask in task.subtasks:
+            self._index_task(subtask, depth=depth + 1, root=root)
+
+    def _index_data(self, data: Dict, depth: int, path: TaskPath):
+        """Index the task and its subtasks from the data, without building.
+
+        Invalid data is skipped, it raises an error once the task is built.
+        """
+        name = decoder.string(data, "task", {}, default=None)
+        if name is not None:
+            self._names.add(name, depth, path, path.root)
+            self._folded_names.add(name.casefold(), depth, path, path.root)
+        synonyms = data.get("synonyms")
+        if decoder.is_collection(synonyms):
+            for synonym in synonyms:
+                try:
+                    self._index_synonym(
+                        decoder.text(synonym), depth, path, path.root
+                    )
+                except ValueError:
+                    pass
+        subtasks = data.get("subtasks")
+        if decoder.is_collection(subtasks):
+            for i, subtask in enumerate(subtasks):
+                if decoder.is_mapping(subtask):
+                    self._index_data(
+                        subtask,
+                        depth=depth + 1,
+                        path=path._replace(subtasks=path.subtasks + (i,)),
+                    )
+
+    def _index_synonym(
+        self, synonym: str, depth: int, task: Union[Task, TaskPath], root: str
+    ):
+        self._synonyms.add(synonym, depth, task, root)
+        self._folded_synonyms.add(synonym.casefold(), depth, task, root)
+
+    def _lookup(
+        self, name: str, synonyms: bool = False, casefold: bool = False
+    ) -> Optional[IndexEntry]:
+        indexes = [(self._names, name)]
+        if synonyms:
+            indexes.append((self._synonyms, name))
+        if casefold:
+            folded = name.casefold()
+            indexes.append((self._folded_names, folded))
+            if synonyms:
+                indexes.append((self._folded_synonyms, folded))
+
+        for index, key in indexes:
+            entry = index.get(key)
+            if entry is not None and isinstance(entry.task, TaskPath):
+                # Building the task replaces the path in the index.
+                self.tasks[entry.root]
+                entry = index.get(key)
+            if entry is not None:
+                return entry
         return None
 
+    def get_task(
+        self, name: str, synonyms: bool = False, casefold: bool = False
+    ) -> Optional[Task]:
+        """Get a task or a sub-task at any depth by name.
+
+        Tasks are looked up in an index kept up to date by `add_task`, so
+        tasks modified after they were added may not be found. If multiple
+        tasks share the name, the one closest to the top level is returned.
+        Lazily loaded tasks are built by the lookup.
+
+        Args:
+            name (str): Name of the task.
+            synonyms (bool): Also look up the task by its synonyms.
+            casefold (bool): If there is no exact match, look up the task
+                ignoring the case.
+
+        Returns:
+            Task: The task or None if it doesn't exist.
+        """
+        entry = self._lookup(name, synonyms=synonyms, casefold=casefold)
+        return None if entry is None else entry.task
+
     def add_task(self, task: Task):
         """Add a top-level task by name."""
+        if task.name in self.tasks:
+            self._unindex(task.name)
         self.tasks[task.name] = task
-
-    def load_tasks(self, files: List[str] = None, data: List[Dict] = None):
+        self._index_task(task, depth=0, root=task.name)
+
+    def load_tasks(
+        self,
+        files: List[str] = None,
+        data: List[Dict] = None,
+        strict: bool = False,
+        fmt: Format = None,
+        lazy: bool = False,
+        compact: bool = False,
+        tasks: List[str] = None,
+    ):
         """Load tasks from files or from data.
 
         Args:
             files (List[str] | str): Path to a document or a list of paths to
                 documents.
             data: Sota data - list of dictionaries representing tasks.
+            strict (bool): Load the data with the marshmallow schema instead
+                of the native decoder. Both validate the data the same way,
+                the decoder is just faster.
+            fmt (Format): Serialization format of the files, inferred from
+                their extensions if not set.
+            lazy (bool): Keep the data of the top-level tasks and build every
+                task with its subtasks the first time it's accessed. Only the
+                names of the top-level tasks are validated by the loading,
+                the rest of the data when the task is built.
+            compact (bool): Build the models from
+                `sota_extractor.taskdb.v01.compact`, using less memory.
+            tasks (List[str]): Names of the top-level tasks to load, all of
+                them by default. Only the shards of these tasks are read from
+                sharded directories.
         """
-        from sota_extractor.serialization import load
+        from sota_extractor.serialization import (
+            infer_format,
+            iter_load,
+            select_tasks,
+        )
 
         if files is None and data is None:
             raise ArgumentError("Either 'files' or 'data' must be supplied.")
+        if strict and lazy:
+            raise ArgumentError("Lazy loading can't be strict.")
+        if strict and compact:
+            raise ArgumentError("Compact models can't be loaded strictly.")
 
         if isinstance(files, str):
             files = [files]
 
         if files is not None:
-            data = []
-            for file in files:
-                data.extend(load(file))
-
-        task_list = self.schema.load(data, many=True)
+            # Tasks are decoded as they are read from the files.
+            data = itertools.chain.from_iterable(
+                iter_load(file, fmt=fmt or infer_format(file), tasks=tasks)
+                for file in files
+            )
+            if strict:
+                data = list(data)
+        elif tasks is not None:
+            data = list(select_tasks(data, tasks))
+
+        if lazy:
+            self._load_lazy(data, compact=compact)
+            return
+
+        if strict:
+            task_list = self.schema.load(data, many=True)
+        elif files is not None:
+            task_list = list(decoder.iter_tasks(data, compact=compact))
+        else:
+            task_list = decoder.load_tasks(data, compact=compact)
         for task in task_list:
             self.add_task(task)
 
-    def load_synonyms(self, csv_files: List[str]):
-        """Load task synonyms from input files."""
+    def _load_lazy(self, data: List[Dict], compact: bool = False):
+        """Add the top-level tasks from the data without building them."""
+        entries = []
+        errors = {}
+        for i, item in enumerate(data):
+            name = None
+            if decoder.is_mapping(item):
+                name = decoder.string(item, "task", {}, default=None)
+            if name is None:
+                # Let the decoder report the errors.
+                try:
+                    decoder.load_task(item)
+                except ValidationError as e:
+                    errors[i] = e.messages
+                    continue
+            entries.append((name, item))
+        if errors:
+            raise ValidationError(errors)
+
+        for name, item in entries:
+            if name in self.tasks:
+                self._unindex(name)
+            self.tasks.entries[name] = TaskData(item, compact)
+            self._index_data(item, depth=0, path=TaskPath(name))
+
+    def load_synonyms(self, csv_files: List[str], casefold: bool = False):
+        """Load task synonyms from input files.
+
+        Args:
+            csv_files (List[str] | str): Path to a CSV file or a list of paths
+                to CSV files with a task name and its synonym on every row.
+            casefold (bool): Match the task names ignoring the case.
+        """
         if isinstance(csv_files, str):
             csv_files = [csv_files]
         for csv_file in csv_files:
             with io.open(csv_file, newline="") as f:
                 reader = csv.reader(f)
                 for row in reader:
-                    task = self.get_task(row[0])
-                    if task is not None:
-                        task.synonyms.append(row[1])
+                    entry = self._lookup(row[0], casefold=casefold)
+                    if entry is not None:
+                        entry.task.synonyms.append(row[1])
+                        self._index_synonym(
+                            row[1], entry.depth, entry.task, entry.root
+                        )
 
     def tasks_with_sota(self) -> List[Task]:
         """Extract all tasks with SOTA tables.
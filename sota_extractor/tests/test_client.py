@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import importlib
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from sota_extractor.errors import HttpClientError
+from sota_extractor.scrapers import aio, utils
+from sota_extractor.scrapers import client
+from sota_extractor.scrapers.client import HttpClient
+
+BODY = b'{"leaderboard": []}'
+ETAG = '"v1"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.server.conditional.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    httpd.conditional = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_conditional_cache(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/out.json"
+    client = HttpClient(cache_dir=str(tmp_path))
+
+    first = client.get(url)
+    assert not first.not_modified
+    assert first.json() == {"leaderboard": []}
+
+    second = client.get(url)
+    assert second.not_modified
+    assert second.status_code == 200
+    assert second.json() == {"leaderboard": []}
+    assert server.conditional == [None, ETAG]
+
+
+def test_no_cache(server):
+    url = f"http://127.0.0.1:{server.server_port}/out.json"
+    client = HttpClient(cache_dir=None)
+    assert not client.get(url).not_modified
+    assert not client.get(url).not_modified
+    assert server.conditional == [None, None]
+
+
+def test_record_replay(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/out.json"
+    bundle = str(tmp_path / "bundle")
+
+    recorder = HttpClient(cache_dir=None, record_dir=bundle)
+    assert recorder.get(url).json() == {"leaderboard": []}
+    assert recorder.get_documents("git://repo", lambda: {"a.md": "# A"}) == {
+        "a.md": "# A"
+    }
+
+    player = HttpClient(cache_dir=None, replay_dir=bundle)
+    assert player.get(url).json() == {"leaderboard": []}
+    assert player.get_documents("git://repo", lambda: {}) == {"a.md": "# A"}
+    assert server.conditional == [None]
+
+    with pytest.raises(HttpClientError):
+        player.get(f"{url}?missing")
+
+
+def test_fetch_texts(server, monkeypatch):
+    monkeypatch.setattr(
+        "sota_extractor.scrapers.client._client", HttpClient(cache_dir=None)
+    )
+    assert utils.fetch_texts([]) == {}
+
+    url = f"http://127.0.0.1:{server.server_port}/out.json"
+    assert utils.fetch_texts([url]) == {url: BODY.decode()}
+
+    missing = f"http://127.0.0.1:{server.server_port}/missing"
+    with pytest.raises(HttpClientError) as error:
+        utils.fetch_texts([url, missing])
+    assert error.value.status_code == 404
+
+
+def test_aget(server, monkeypatch):
+    monkeypatch.setattr(
+        "sota_extractor.scrapers.client._client", HttpClient(cache_dir=None)
+    )
+    url = f"http://127.0.0.1:{server.server_port}/out.json"
+    response = asyncio.run(client.aget(url))
+    assert response.json() == {"leaderboard": []}
+
+    missing = f"http://127.0.0.1:{server.server_port}/missing"
+    assert asyncio.run(client.aget(missing)).status_code == 404
+
+
+def test_aio_scrape(server, monkeypatch):
+    monkeypatch.setattr(
+        "sota_extractor.scrapers.client._client", HttpClient(cache_dir=None)
+    )
+    # The package exports the scraper functions under the module names.
+    coqa = importlib.import_module("sota_extractor.scrapers.coqa")
+    url = f"http://127.0.0.1:{server.server_port}/out.json"
+    monkeypatch.setattr(coqa, "JSON_URL", url)
+
+    tdb = asyncio.run(aio.scrape("coqa"))
+    assert tdb.export() == coqa.parse({url: BODY.decode()}).export()
+    assert asyncio.run(aio.coqa()).export() == tdb.export()
+
+    monkeypatch.setattr(
+        coqa, "JSON_URL", f"http://127.0.0.1:{server.server_port}/missing"
+    )
+    with pytest.raises(HttpClientError):
+        asyncio.run(aio.scrape("coqa"))
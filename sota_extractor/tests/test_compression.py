@@ -0,0 +1,18 @@
+import gzip
+
+from sota_extractor.compression import GzipWriter
+
+
+def test_gzip_writer(tmp_path):
+    data = bytes(range(256)) * 1000
+    filename = str(tmp_path / "test.gz")
+    with GzipWriter(filename, workers=2, block_size=10000) as f:
+        for i in range(0, len(data), 3000):
+            f.write(data[i : i + 3000])
+    with gzip.open(filename, mode="rb") as f:
+        assert f.read() == data
+
+    with GzipWriter(filename):
+        pass
+    with gzip.open(filename, mode="rb") as f:
+        assert f.read() == b""
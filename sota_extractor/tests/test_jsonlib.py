@@ -0,0 +1,56 @@
+import pytest
+
+from sota_extractor.jsonlib import get_backend
+
+pytest.importorskip("orjson")
+
+DATA = [
+    {
+        "text": 'café   \x7f \x00 \U0001f600 "quoted" \\ 1e5, 0.00001',
+        "floats": [0.1, 1e-05, 1e-07, 1.5e16, -2.5e-300, 100.0],
+        "ints": [0, -1, 2**63 - 1, 2**64, 2**64 + 1, -(2**63) - 1],
+        "nested": {"b": [], "a": {}, "c": [None, True, False]},
+    },
+    1e16,
+    "é",
+]
+
+
+@pytest.mark.parametrize("data", DATA)
+@pytest.mark.parametrize("indent", [False, True])
+def test_orjson_backend(data, indent):
+    stdlib = get_backend("stdlib")
+    orjson = get_backend("orjson")
+    assert orjson.dumps(data, indent=indent) == stdlib.dumps(
+        data, indent=indent
+    )
+    assert orjson.loads(stdlib.dumps(data)) == data
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_orjson_backend_non_finite(indent):
+    data = {"metrics": [float("nan"), float("inf"), -float("inf"), None]}
+    stdlib = get_backend("stdlib")
+    orjson = get_backend("orjson")
+    text = orjson.dumps(data, indent=indent)
+    assert text == stdlib.dumps(data, indent=indent)
+    assert "NaN" in text and "-Infinity" in text
+    assert orjson.loads(text)["metrics"][1:] == data["metrics"][1:]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[18446744073709551617]",
+        '{"value": -9223372036854775809}',
+        '{"values": [1, 2.5, 100000000000000000000000000001]}',
+        '{"values": [9223372036854775807, "18446744073709551617"]}',
+    ],
+)
+def test_orjson_backend_big_integers(text):
+    stdlib = get_backend("stdlib")
+    orjson = get_backend("orjson")
+    data = orjson.loads(text)
+    assert data == stdlib.loads(text)
+    assert orjson.loads(text.encode("utf-8")) == data
+    assert orjson.dumps(data) == stdlib.dumps(data)
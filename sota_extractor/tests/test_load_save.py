@@ -1,3 +1,9 @@
+import os
+import gzip
+import json
+
+from sota_extractor import serialization, shards
+from sota_extractor.consts import Format
 from sota_extractor.taskdb.v01 import taskdb
 
 
@@ -5,3 +11,87 @@ def test_load_save():
     tdb = taskdb.TaskDB()
     tdb.load_tasks(["data/tasks/nlpprogress.json"])
     tdb.export_to_file("test.json")
+
+
+def test_dumps():
+    tdb = taskdb.TaskDB()
+    assert serialization.dumps(tdb) == "[]"
+    tdb.load_tasks(["data/tasks/nlpprogress.json"])
+    assert serialization.dumps(tdb) == json.dumps(
+        tdb.export(), indent=2, sort_keys=True
+    )
+
+
+def test_iter_load():
+    with open("data/tasks/nlpprogress.json") as f:
+        data = json.load(f)
+    with open("data/tasks/nlpprogress.json") as f:
+        assert list(serialization.ArrayReader(f, chunk_size=16)) == data
+
+    tasks = list(serialization.iter_tasks("data/tasks/nlpprogress.json"))
+    assert [task.name for task in tasks] == [task["task"] for task in data]
+
+
+def test_load_save_jsonl(tmp_path):
+    tdb = taskdb.TaskDB()
+    tdb.load_tasks(["data/tasks/nlpprogress.json"])
+    for fmt in [Format.jsonl, Format.jsonl_gz]:
+        filename = str(tmp_path / f"test.{fmt.value}")
+        tdb.export_to_file(filename, fmt=fmt)
+
+        loaded = taskdb.TaskDB()
+        loaded.load_tasks(filename)
+        assert loaded.export() == tdb.export()
+
+
+def test_load_save_shards(tmp_path):
+    tdb = taskdb.TaskDB()
+    tdb.load_tasks(["data/tasks/nlpprogress.json"])
+    directory = str(tmp_path / "nlpprogress.shards")
+    tdb.export_to_file(directory, fmt=Format.shards)
+
+    loaded = taskdb.TaskDB()
+    loaded.load_tasks(directory)
+    assert loaded.export() == tdb.export()
+
+    task = next(iter(loaded.tasks.values()))
+    task.description = "Changed."
+    assert shards.dump(loaded, directory) == [
+        os.path.join(directory, shards.shard_filename(task.name))
+    ]
+    assert shards.dump(loaded, directory) == []
+
+
+def test_load_shards_subset(tmp_path):
+    tdb = taskdb.TaskDB()
+    tdb.load_tasks(["data/tasks/nlpprogress.json"])
+    directory = str(tmp_path / "nlpprogress.shards")
+    tdb.export_to_file(directory, fmt=Format.shards)
+
+    names = list(tdb.tasks)[1:3]
+    # Only the shards of the selected tasks may be opened.
+    for name in tdb.tasks:
+        if name not in names:
+            os.remove(os.path.join(directory, shards.shard_filename(name)))
+
+    loaded = taskdb.TaskDB()
+    loaded.load_tasks(directory, tasks=names)
+    assert list(loaded.tasks) == names
+    assert loaded.export() == [tdb.schema.dump(tdb.tasks[n]) for n in names]
+
+    loaded = taskdb.TaskDB()
+    loaded.load_tasks("data/tasks/nlpprogress.json", tasks=names)
+    assert list(loaded.tasks) == names
+
+
+def test_load_gzip(tmp_path):
+    tdb = taskdb.TaskDB()
+    tdb.load_tasks(["data/tasks/nlpprogress.json"])
+    filename = str(tmp_path / "test.json.gz")
+    tdb.export_to_file(filename, fmt=Format.json_gz)
+    assert serialization.load(filename, fmt=Format.json_gz) == tdb.export()
+
+    filename = str(tmp_path / "object.json.gz")
+    with gzip.open(filename, "wt") as f:
+        json.dump({"tasks": []}, f)
+    assert serialization.load(filename, fmt=Format.json_gz) == {"tasks": []}
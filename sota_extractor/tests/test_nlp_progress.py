@@ -0,0 +1,187 @@
+import io
+import os
+import glob
+
+import pytest
+
+from sota_extractor.consts import CACHE_DIR
+from sota_extractor.scrapers.client import HttpClient
+from sota_extractor.scrapers.nlp_progress import main
+from sota_extractor.scrapers.nlp_progress.markdown import parse_string
+from sota_extractor.scrapers.nlp_progress.parsers import Model
+
+SAMPLE = """# Machine translation
+
+Machine translation is the task of translating a sentence, see
+[WMT](http://www.statmt.org/) &amp; <b>WMT 2014</b>.
+Some *emphasis*, `code`, \\*escapes\\* and a
+line break.
+
+### Table of contents
+
+- [WMT 2014 EN-DE](#wmt-2014-en-de)
+    - [Nested](#nested)
+
+## Sentence-level
+Description of [the subtask](http://sub.task/a_b).
+### WMT 2014 EN-DE
+
+Models are evaluated on [WMT](https://www.statmt.org/wmt14/).
+
+| Model | BLEU | Paper / Source | Code |
+| --- | :---: | --- | --- |
+| Big (Edunov et al., 2018) | 35.0 | [BT](http://a.b/c_d) | [C](http://e) |
+| DeepL | 33.3 | [DeepL *press*](https://www.deepl.com/press) | |
+| Short row | 1 |
+| Escaped \\| pipe | 1 | [Paper](http://c) | |
+
+### Multi ###
+Description of the subdatasets.
+
+    code block
+
+> A quote
+
+**Dev:**
+
+| Model | F1 | Paper |
+|---|---|---|
+| A (X et al., 2019) | 1.0 | [P](https://arxiv.org/abs/1) |
+
+**Test:**
+
+Model | F1 | Paper
+--- | --- | ---
+B (Y et al., 2020) | 2.0 | [Q](https://arxiv.org/abs/2) `|` x
+
+[Go back to the README](../README.md)
+"""
+
+
+FIXTURES = sorted(
+    glob.glob(
+        os.path.join(
+            os.path.dirname(__file__), "fixtures", "nlp_progress", "*.md"
+        )
+    )
+)
+
+
+def corpus():
+    if CACHE_DIR is None:
+        return []
+    return sorted(
+        glob.glob(os.path.join(CACHE_DIR, "nlp-progress", "english", "*.md"))
+    )
+
+
+def test_line_parser():
+    tdb = parse_string(SAMPLE)
+    assert tdb.export() == parse_string(SAMPLE, line_parser=True).export()
+    assert len(tdb.tasks) == 1
+
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_line_parser_fixtures(filename):
+    with io.open(filename, mode="r", encoding="utf-8") as f:
+        text = f.read()
+    tdb = parse_string(text)
+    assert tdb.export() == parse_string(text, line_parser=True).export()
+    assert len(tdb.tasks) > 0
+
+
+@pytest.mark.skipif(
+    len(corpus()) == 0, reason="NLP-progress checkout is not cached."
+)
+@pytest.mark.parametrize("filename", corpus())
+def test_line_parser_corpus(filename):
+    with io.open(filename, mode="r", encoding="utf-8") as f:
+        text = f.read()
+    assert (
+        parse_string(text).export()
+        == parse_string(text, line_parser=True).export()
+    )
+
+
+@pytest.mark.parametrize(
+    "cell",
+    [
+        "Big (Edunov et al., 2018)",
+        "  BERT_large+ITPT\n(Sun et al., 2019) ",
+        "Andor et al. (2016)",
+        "CVT (Clark et al., 2018) with additional unlabeled data",
+        "DeepL",
+        "",
+    ],
+)
+def test_model_parse_cache(cell):
+    cached = Model.parse(cell)
+    assert Model.parse(cell) is cached
+    assert vars(cached) == vars(Model.parse.__wrapped__(Model, cell))
+
+
+def read_fixtures():
+    payload = {}
+    for filename in FIXTURES:
+        with io.open(filename, mode="r", encoding="utf-8") as f:
+            payload[f"english/{os.path.basename(filename)}"] = f.read()
+    return payload
+
+
+def test_parse_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "sota_extractor.scrapers.client._client",
+        HttpClient(cache_dir=str(tmp_path)),
+    )
+    payload = read_fixtures()
+    shas = {text: f"sha{i}" for i, text in enumerate(payload.values())}
+    monkeypatch.setattr(main, "blob_sha", lambda content: shas[content])
+    parsed = []
+    parse_strings = main.parse_strings
+
+    def record(texts, **kwargs):
+        parsed.extend(texts)
+        return parse_strings(texts, **kwargs)
+
+    monkeypatch.setattr(main, "parse_strings", record)
+
+    expected = main.parse(payload, workers=1).export()
+    assert parsed == list(payload.values())
+
+    # Files with unchanged blob SHAs are not parsed again.
+    parsed.clear()
+    assert main.parse(payload, workers=1).export() == expected
+    assert parsed == []
+
+    # Only the changed file is parsed again.
+    filename = next(iter(payload))
+    payload[filename] += (
+        "\n# Other task\n\n### Data\n\n| Model | F1 | Paper |\n|---|---|---|\n"
+        "| A (X et al., 2019) | 1.0 | [P](https://a.b) |\n"
+    )
+    shas[payload[filename]] = "changed"
+    tdb = main.parse(payload, workers=1)
+    assert parsed == [payload[filename]]
+    assert "Other Task" in tdb.tasks
+
+    # Invalid cache entries are parsed again.
+    parsed.clear()
+    entry = tmp_path / "nlp-progress-files" / f"sha1-{main.VERSION}.json"
+    entry.write_text('[{"task": 1}]', encoding="utf-8")
+    assert main.parse(payload, workers=1).export() == tdb.export()
+    assert parsed == [list(payload.values())[1]]
+
+
+def test_parse_workers(monkeypatch):
+    monkeypatch.setattr(
+        "sota_extractor.scrapers.client._client", HttpClient(cache_dir=None)
+    )
+    payload = read_fixtures()
+    payload["english/sample.md"] = SAMPLE
+    # Reverse the order of the files, they are merged in the payload order.
+    payload = dict(reversed(list(payload.items())))
+    tdb = main.parse(payload, workers=1)
+    assert main.parse(payload, workers=2).export() == tdb.export()
+    assert list(tdb.tasks) == [
+        task for text in payload.values() for task in parse_string(text).tasks
+    ]
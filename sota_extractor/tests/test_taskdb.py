@@ -0,0 +1,275 @@
+import sys
+import json
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from marshmallow import ValidationError
+
+from sota_extractor.taskdb.v01 import Link, SotaRow, Sota, Dataset, Task
+from sota_extractor.taskdb.v01 import TaskDB, SqliteTaskDB
+from sota_extractor.taskdb.v01 import compact, decoder
+from sota_extractor.taskdb.v01.schemas import TaskSchema
+
+
+def test_get_task():
+    task = Task(name="Parsing")
+    subtask = Task(name="Dependency Parsing", parent=task)
+    subsubtask = Task(name="Unsupervised Dependency Parsing", parent=subtask)
+    subtask.subtasks.append(subsubtask)
+    task.subtasks.append(subtask)
+
+    tdb = TaskDB()
+    tdb.add_task(task)
+    tdb.add_task(Task(name="Dependency Parsing"))
+
+    assert tdb.get_task("Parsing") is task
+    assert (
+        tdb.get_task("Dependency Parsing") is tdb.tasks["Dependency Parsing"]
+    )
+    assert tdb.get_task("Unsupervised Dependency Parsing") is subsubtask
+    assert tdb.get_task("unsupervised dependency parsing") is None
+    assert (
+        tdb.get_task("unsupervised dependency parsing", casefold=True)
+        is subsubtask
+    )
+
+    subtask.synonyms.append("Dependency Grammar Induction")
+    tdb.add_task(task)
+    assert tdb.get_task("Dependency Grammar Induction") is None
+    assert (
+        tdb.get_task("Dependency Grammar Induction", synonyms=True) is subtask
+    )
+
+
+def test_add_task_replace():
+    first = Task(name="Parsing", subtasks=[Task(name="Tagging")])
+    second = Task(name="Syntax", subtasks=[Task(name="Tagging")])
+    tdb = TaskDB()
+    tdb.add_task(first)
+    tdb.add_task(second)
+    assert tdb.get_task("Tagging") is first.subtasks[0]
+
+    # The replaced subtree is dropped, the other tasks stay indexed.
+    tdb.add_task(Task(name="Parsing"))
+    assert tdb.get_task("Tagging") is second.subtasks[0]
+    assert tdb.get_task("tagging", casefold=True) is second.subtasks[0]
+    assert len(tdb._names.entries["Tagging"]) == 1
+
+    tdb.load_tasks(data=[{"task": "Syntax"}], lazy=True)
+    assert tdb.get_task("Tagging") is None
+    assert tdb.get_task("Syntax") is tdb.tasks["Syntax"]
+    assert set(tdb._names.roots) == {"Parsing", "Syntax"}
+
+
+def test_load_tasks():
+    data = [
+        {
+            "task": "Parsing",
+            "datasets": [
+                {
+                    "dataset": "Penn Treebank",
+                    "sota": {
+                        "metrics": ["F1"],
+                        "rows": [
+                            {
+                                "model_name": "Model",
+                                "paper_date": "2019-01-02",
+                                "metrics": {"F1": "95.1"},
+                                "uses_additional_data": "yes",
+                            }
+                        ],
+                    },
+                    "subdatasets": [{"subdataset": "Dev"}],
+                }
+            ],
+            "subtasks": [{"task": "Dependency Parsing"}],
+        }
+    ]
+    native = TaskDB()
+    native.load_tasks(data=data)
+    strict = TaskDB()
+    strict.load_tasks(data=data, strict=True)
+    assert native.export() == strict.export()
+
+    null_metric = {
+        "task": "Parsing",
+        "datasets": [
+            {
+                "dataset": "Penn Treebank",
+                "sota": {
+                    "rows": [{"model_name": "M", "metrics": {"EM": None}}]
+                },
+            }
+        ],
+    }
+    for invalid in [
+        [{"datasets": {}, "source_link": [], "unknown": 1}, 1],
+        [null_metric],
+    ]:
+        with pytest.raises(ValidationError) as native_error:
+            TaskDB().load_tasks(data=invalid)
+        with pytest.raises(ValidationError) as strict_error:
+            TaskDB().load_tasks(data=invalid, strict=True)
+        assert native_error.value.messages == strict_error.value.messages
+
+
+def test_sqlite_taskdb():
+    tdb = TaskDB()
+    tdb.load_tasks("data/tasks/nlpprogress.json")
+    sqlite_tdb = SqliteTaskDB()
+    sqlite_tdb.load_tasks("data/tasks/nlpprogress.json")
+    assert sqlite_tdb.export() == tdb.export()
+
+    assert [task.name for task in sqlite_tdb.tasks_with_sota()] == [
+        task.name for task in tdb.tasks_with_sota()
+    ]
+    assert [dataset.name for dataset in sqlite_tdb.datasets_with_sota()] == [
+        dataset.name for dataset in tdb.datasets_with_sota()
+    ]
+
+    task = sqlite_tdb.get_task("amr parsing", casefold=True)
+    assert task.name == tdb.get_task("AMR parsing").name
+    assert task.parent.name == tdb.get_task("AMR parsing").parent.name
+    assert sqlite_tdb.get_task("amr parsing") is None
+
+    sqlite_tdb.add_task(Task(name=tdb.export()[0]["task"]))
+    assert len(sqlite_tdb.export()) == len(tdb.export())
+    assert sqlite_tdb.export()[0]["subtasks"] == []
+
+    with pytest.raises(ValidationError):
+        sqlite_tdb.load_tasks(data=[{"task": "Parsing"}, 1])
+    assert sqlite_tdb.get_task("Parsing") is None
+
+
+def test_sqlite_taskdb_synonyms():
+    tdb = TaskDB()
+    tdb.load_tasks("data/tasks/nlpprogress.json")
+    tdb.load_synonyms("data/tasks/synonyms.csv", casefold=True)
+    sqlite_tdb = SqliteTaskDB()
+    sqlite_tdb.load_tasks("data/tasks/nlpprogress.json")
+    sqlite_tdb.load_synonyms("data/tasks/synonyms.csv", casefold=True)
+    assert sqlite_tdb.export() == tdb.export()
+
+    names = [synonym for task in tdb.export() for synonym in task["synonyms"]]
+    assert names
+    for name in names:
+        expected = tdb.get_task(name, synonyms=True)
+        assert sqlite_tdb.get_task(name, synonyms=True).name == expected.name
+
+
+def test_sqlite_taskdb_threads():
+    sqlite_tdb = SqliteTaskDB()
+    sqlite_tdb.load_tasks("data/tasks/nlpprogress.json")
+    names = [task["task"] for task in sqlite_tdb.export()]
+
+    def get_task(name):
+        sqlite_tdb.add_task(Task(name=f"{name} copy"))
+        return sqlite_tdb.get_task(name).name
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(get_task, names)) == names
+    assert len(sqlite_tdb.export()) == 2 * len(names)
+
+
+def test_sqlite_taskdb_values():
+    row = SotaRow(
+        model_name="Model",
+        paper_title=None,
+        paper_date=datetime.datetime(
+            2019, 1, 2, 23, 30, tzinfo=datetime.timezone.utc
+        ),
+        code_links=[Link(title=None, url="https://example.com")],
+        metrics={"EM": 71.5},
+    )
+    dataset = Dataset(name="SQuAD", sota=Sota(metrics=["EM"], rows=[row]))
+    task = Task(name="Question answering", datasets=[dataset])
+    tdb = TaskDB()
+    tdb.add_task(task)
+    sqlite_tdb = SqliteTaskDB()
+    sqlite_tdb.add_task(task)
+
+    assert sqlite_tdb.export() == tdb.export()
+    stored = sqlite_tdb.get_task("Question answering").datasets[0].sota.rows[0]
+    assert stored.paper_date == datetime.date(2019, 1, 2)
+    assert stored.paper_title is None
+    assert stored.code_links[0].title is None
+
+
+def test_load_tasks_lazy():
+    tdb = TaskDB()
+    tdb.load_tasks("data/tasks/nlpprogress.json")
+    lazy = TaskDB()
+    lazy.load_tasks("data/tasks/nlpprogress.json", lazy=True)
+    assert not any(lazy.tasks.is_loaded(name) for name in lazy.tasks)
+
+    task = lazy.get_task("amr parsing", casefold=True)
+    assert task.name == "AMR parsing"
+    assert task.parent is lazy.tasks[task.parent.name]
+    assert lazy.tasks.is_loaded(task.parent.name)
+    assert sum(lazy.tasks.is_loaded(name) for name in lazy.tasks) == 1
+    assert lazy.export() == tdb.export()
+
+    with pytest.raises(ValidationError) as error:
+        lazy.load_tasks(data=[{"task": "Parsing"}, {}], lazy=True)
+    assert error.value.messages == {
+        1: {"task": ["Missing data for required field."]}
+    }
+    lazy.load_tasks(data=[{"task": "Parsing", "datasets": {}}], lazy=True)
+    with pytest.raises(ValidationError):
+        lazy.get_task("Parsing")
+
+
+def test_load_tasks_lazy_changes():
+    files = ["data/tasks/nlpprogress.json", "data/tasks/squad.json"]
+    tdb = TaskDB()
+    lazy = TaskDB()
+    tdb.load_tasks(files)
+    lazy.load_tasks(files, lazy=True)
+    for db in [tdb, lazy]:
+        db.add_task(Task(name="Parsing", subtasks=[Task(name="Chunking")]))
+        db.load_synonyms("data/tasks/synonyms.csv")
+    assert lazy.export() == tdb.export()
+
+    # Changing the subtasks of a built task doesn't break the lookups.
+    lazy = TaskDB()
+    lazy.load_tasks(files, lazy=True)
+    task = lazy.get_task("AMR parsing")
+    parent = task.parent
+    parent.subtasks.insert(0, Task(name="Inserted", parent=parent))
+    assert lazy.get_task("AMR parsing") is task
+    assert lazy.get_task("Inserted") is None
+
+
+def test_compact_models():
+    with open("data/tasks/nlpprogress.json") as f:
+        data = json.load(f)
+    tasks = decoder.load_tasks(data, compact=True)
+    schema = TaskSchema()
+    assert schema.dump(tasks, many=True) == schema.dump(
+        decoder.load_tasks(data), many=True
+    )
+    assert all(isinstance(task, compact.Task) for task in tasks)
+    assert not hasattr(tasks[0], "__dict__")
+
+    row = compact.SotaRow(
+        model_name="Model", metrics={"".join(["F", "1"]): "95.1"}
+    )
+    assert next(iter(row.metrics)) is sys.intern("F1")
+    row.code_links.append(compact.Link(title="Code"))
+    assert row.code_links == [compact.Link(title="Code")]
+    assert compact.SotaRow(model_name="Model").code_links == []
+
+    tdb = TaskDB()
+    tdb.load_tasks("data/tasks/nlpprogress.json")
+    tdb.load_synonyms("data/tasks/synonyms.csv")
+    for lazy in [False, True]:
+        compact_tdb = TaskDB()
+        compact_tdb.load_tasks(
+            "data/tasks/nlpprogress.json", lazy=lazy, compact=True
+        )
+        compact_tdb.load_synonyms("data/tasks/synonyms.csv")
+        task = compact_tdb.get_task("AMR parsing")
+        assert isinstance(task, compact.Task)
+        assert task.synonyms == ["Abstract Meaning Representation Parsing"]
+        assert compact_tdb.export() == tdb.export()